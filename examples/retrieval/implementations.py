@@ -1,11 +1,14 @@
 """Toy implementations of retriever and reranker for demonstration."""
 
 import hashlib
+import heapq
 import json
 import pickle
 import re
+from collections import Counter, defaultdict
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .models import (
     Query,
@@ -15,10 +18,12 @@ from .models import (
 )
 
 
+_TOKEN_RE = re.compile(r"[a-zA-Z]+")
+
+
 def normalize(text: str) -> set[str]:
     """Normalize text for simple token matching."""
-    toks = re.findall(r"[a-zA-Z]+", text.lower())
-    return {t[:-1] if t.endswith("s") else t for t in toks}
+    return {t[:-1] if t[-1] == "s" else t for t in _TOKEN_RE.findall(text.lower())}
 
 
 class ToyRetriever:
@@ -31,6 +36,10 @@ class ToyRetriever:
             corpus: Dictionary mapping doc_id to document text
         """
         self.config = config
+        # Loaded indexes (doc ids and token postings) and query token sets,
+        # reused across retrieve calls
+        self._indexes: Dict[str, Tuple[List[str], Dict[str, List[int]]]] = {}
+        self._query_tokens: Dict[str, frozenset[str]] = {}
 
     def __cache_key__(self):
         """Return deterministic cache key based on configuration."""
@@ -38,7 +47,9 @@ class ToyRetriever:
 
     def index(self, corpus: Dict[str, str]) -> str:
         """Index the corpus and write to disk."""
-        doc_tokens = {doc_id: normalize(txt) for doc_id, txt in corpus.items()}
+        doc_tokens = {
+            doc_id: frozenset(normalize(txt)) for doc_id, txt in corpus.items()
+        }
 
         # Create a deterministic filename based on config and corpus
         config_str = json.dumps(self.config, sort_keys=True)
@@ -59,17 +70,48 @@ class ToyRetriever:
 
     def retrieve(self, index_path: str, query: Query, top_k: int) -> RetrievalResult:
         """Retrieve documents using token overlap scoring."""
-        # Load index from disk
-        with open(index_path, "rb") as f:
-            doc_tokens = pickle.load(f)
-
-        q = normalize(query.text)
-        scored = [
-            RetrievalHit(doc_id=d, score=float(len(q & toks)))
-            for d, toks in doc_tokens.items()
-        ]
-        scored.sort(key=lambda h: h.score, reverse=True)
-        return RetrievalResult(query_uuid=query.query_uuid, hits=scored[:top_k])
+        doc_ids, postings = self._load_index(index_path)
+
+        q = self._query_tokens.get(query.text)
+        if q is None:
+            q = self._query_tokens[query.text] = frozenset(normalize(query.text))
+
+        # Count overlaps by walking only the postings of the query's tokens
+        counts: Counter[int] = Counter()
+        for token in q:
+            counts.update(postings.get(token, ()))
+
+        # Highest score first, corpus order among equal scores (like a stable
+        # sort); models are only built for the top_k
+        top = heapq.nlargest(top_k, counts.items(), key=lambda p: (p[1], -p[0]))
+        if len(top) < top_k:
+            # Documents without any overlap fill the rest with score 0
+            top.extend(
+                islice(
+                    ((pos, 0) for pos in range(len(doc_ids)) if pos not in counts),
+                    top_k - len(top),
+                )
+            )
+        hits = [RetrievalHit(doc_id=doc_ids[pos], score=float(c)) for pos, c in top]
+        return RetrievalResult(query_uuid=query.query_uuid, hits=hits)
+
+    def _load_index(self, index_path: str) -> Tuple[List[str], Dict[str, List[int]]]:
+        """Load an index once per path and invert it into token postings.
+
+        Index files are content-addressed, so a loaded index never goes stale.
+        Postings hold corpus positions so ties can be broken by corpus order.
+        """
+        index = self._indexes.get(index_path)
+        if index is None:
+            with open(index_path, "rb") as f:
+                doc_tokens = pickle.load(f)
+            doc_ids = list(doc_tokens)
+            postings: Dict[str, List[int]] = defaultdict(list)
+            for pos, toks in enumerate(doc_tokens.values()):
+                for token in toks:
+                    postings[token].append(pos)
+            index = self._indexes[index_path] = (doc_ids, dict(postings))
+        return index
 
 
 class IdentityReranker:
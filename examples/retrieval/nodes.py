@@ -1,5 +1,6 @@
 """DAG node definitions for retrieval pipeline."""
 
+import heapq
 from typing import Dict, List
 
 from daft_func import func
@@ -9,6 +10,7 @@ from .models import (
     Query,
     RerankedHit,
     Reranker,
+    RetrievalHit,
     RetrievalResult,
     Retriever,
 )
@@ -87,9 +89,14 @@ def retrieve_with_index(
     depend on mutable object state.
     """
     q = normalize(query.text)
-    scored = [(doc_id, float(len(q & toks))) for doc_id, toks in index_artifact.items()]
-    scored.sort(key=lambda t: t[1], reverse=True)
-    from .models import RetrievalHit
-
-    top = [RetrievalHit(doc_id=d, score=s) for d, s in scored[:top_k]]
+    # Select the top_k lazily instead of sorting the whole corpus; -pos keeps
+    # corpus order among equal scores, like a stable descending sort
+    scored = (
+        (len(q & toks), -pos, doc_id)
+        for pos, (doc_id, toks) in enumerate(index_artifact.items())
+    )
+    top = [
+        RetrievalHit(doc_id=doc_id, score=float(score))
+        for score, _, doc_id in heapq.nlargest(top_k, scored)
+    ]
     return RetrievalResult(query_uuid=query.query_uuid, hits=top)
@@ -2,7 +2,7 @@
 
 Implements dependency-aware incremental caching with:
 - Signature-based cache invalidation
-- Diskcache storage backend
+- Diskcache storage backend with a SQLite metadata index
 - Code change detection with dependency tracking
 """
 
@@ -10,11 +10,32 @@ import ast
 import hashlib
 import inspect
 import json
+import sqlite3
+import threading
+import types
+import weakref
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
 
 if TYPE_CHECKING:
     from typing import CacheBackend
@@ -34,8 +55,10 @@ class CacheEvent:
 class CacheStats:
     """Statistics collector for cache operations during a run."""
 
-    def __init__(self):
+    def __init__(self, on_event: Optional[Callable[[CacheEvent], None]] = None):
         self.events: list[CacheEvent] = []
+        # Called with each event as it is recorded
+        self.on_event = on_event
 
     def record(
         self,
@@ -46,15 +69,16 @@ class CacheStats:
         execution_time: float = 0.0,
     ):
         """Record a cache event."""
-        self.events.append(
-            CacheEvent(
-                node_name=node_name,
-                cache_enabled=cache_enabled,
-                cache_hit=cache_hit,
-                loaded=loaded,
-                execution_time=execution_time,
-            )
+        event = CacheEvent(
+            node_name=node_name,
+            cache_enabled=cache_enabled,
+            cache_hit=cache_hit,
+            loaded=loaded,
+            execution_time=execution_time,
         )
+        self.events.append(event)
+        if self.on_event is not None:
+            self.on_event(event)
 
     def print_summary(self):
         """Print a concise summary of cache operations."""
@@ -99,6 +123,11 @@ class NodeSignature:
     deps_hash: str
     timestamp: float
 
+    @cached_property
+    def combined(self) -> str:
+        """Concatenated hashes identifying this computation, built once."""
+        return f"{self.code_hash}{self.env_hash}{self.inputs_hash}{self.deps_hash}"
+
 
 def compute_code_hash(fn: Any) -> str:
     """Compute hash of function's source code.
@@ -228,6 +257,122 @@ def compute_deps_hash(
     return ""
 
 
+# Dumps of deeply immutable Pydantic models keyed by id(), so a model shared
+# across nodes and items is serialized once. Entries are dropped when the
+# instance is collected, before its id can be reused.
+_FROZEN_DUMPS: Dict[int, Any] = {}
+
+# Canonical encoder for input hashes, built once instead of per json.dumps
+# call (same output as json.dumps(..., sort_keys=True, default=str))
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _has_stable_json(
+    tp: Any, seen: FrozenSet[type] = frozenset(), floats: bool = False
+) -> bool:
+    """Whether values of an annotation serialize to the same JSON every time.
+
+    Dicts and sets are excluded: their JSON follows insertion or hash order,
+    which can differ between equal values (and between processes for sets).
+    Floats only count when the enclosing model sets ``ser_json_inf_nan`` to
+    "constants": the default writes inf, -inf and NaN as null (the same as
+    None), and "strings" makes them collide with the strings "Infinity" etc.
+    """
+    if tp is float:
+        return floats
+    if tp in _JSON_SCALARS:
+        return True
+    origin = get_origin(tp)
+    if origin in (list, tuple, Union, types.UnionType):
+        return all(
+            _has_stable_json(a, seen, floats) for a in get_args(tp) if a is not ...
+        )
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        if tp in seen:
+            return True
+        config = tp.model_config
+        # Extra fields aren't declared, so their values can't be checked
+        if config.get("extra") == "allow":
+            return False
+        floats = config.get("ser_json_inf_nan") == "constants"
+        return all(
+            _has_stable_json(f.annotation, seen | {tp}, floats)
+            for f in tp.model_fields.values()
+        )
+    return False
+
+
+def _is_immutable(tp: Any, seen: FrozenSet[type] = frozenset()) -> bool:
+    """Whether values of an annotation can never change after validation.
+
+    ``frozen=True`` only blocks field assignment, so a frozen model is
+    immutable only if its fields are too (no lists, dicts or mutable models).
+    """
+    if tp in _JSON_SCALARS or tp is bytes:
+        return True
+    origin = get_origin(tp)
+    if origin is Literal:
+        return True
+    if origin in (tuple, frozenset, Union, types.UnionType):
+        return all(_is_immutable(a, seen) for a in get_args(tp) if a is not ...)
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        config = tp.model_config
+        if not config.get("frozen") or config.get("extra") == "allow":
+            return False
+        return tp in seen or all(
+            _is_immutable(f.annotation, seen | {tp})
+            for f in tp.model_fields.values()
+        )
+    return False
+
+
+@lru_cache(maxsize=None)
+def _model_is_immutable(cls: type) -> bool:
+    """_is_immutable for a model class, resolved once per class."""
+    return _is_immutable(cls)
+
+
+@lru_cache(maxsize=None)
+def _model_has_stable_json(cls: type) -> bool:
+    """_has_stable_json for a model class, resolved once per class."""
+    return _has_stable_json(cls)
+
+
+def _serialize_model(obj: BaseModel) -> Any:
+    """Serialize a model for hashing.
+
+    Models whose fields always produce the same JSON go through pydantic's
+    Rust serializer straight to a JSON string, which the key's json.dumps
+    embeds as-is; others are dumped to Python values for canonical encoding.
+    """
+    cls = type(obj)
+    if _model_has_stable_json(cls):
+        try:
+            return {"__json__": cls.__pydantic_serializer__.to_json(obj).decode()}
+        except PydanticSerializationError:
+            pass
+    return obj.model_dump()
+
+
+def _dump_model(obj: BaseModel) -> Any:
+    """Dump a Pydantic model for hashing, reusing the dump of immutable models."""
+    if not _model_is_immutable(type(obj)):
+        return _serialize_model(obj)
+    key = id(obj)
+    dumped = _FROZEN_DUMPS.get(key)
+    if dumped is None:
+        dumped = _serialize_model(obj)
+        try:
+            weakref.finalize(obj, _FROZEN_DUMPS.pop, key, None)
+        except TypeError:
+            return dumped
+        _FROZEN_DUMPS[key] = dumped
+    return dumped
+
+
 def compute_inputs_hash(
     kwargs: Dict[str, Any],
     serialization_depth: int = 2,
@@ -259,9 +404,9 @@ def compute_inputs_hash(
                 }
             return {"__cache_key__": str(obj.__cache_key__())}
 
-        # Strategy 2: Pydantic models
+        # Strategy 2: Pydantic models (deeply immutable ones are dumped once)
         if isinstance(obj, BaseModel):
-            return obj.model_dump()
+            return _dump_model(obj)
 
         # Strategy 3: Lists and tuples (recursive with depth tracking)
         elif isinstance(obj, (list, tuple)):
@@ -275,11 +420,7 @@ def compute_inputs_hash(
                 try:
                     items_sorted = sorted(items)
                 except TypeError:
-                    import json as _json
-
-                    items_sorted = sorted(
-                        [_json.dumps(it, sort_keys=True, default=str) for it in items]
-                    )
+                    items_sorted = sorted(_KEY_ENCODER.encode(it) for it in items)
                 return {"__set__": items_sorted}
             except Exception:
                 # Fallback to string representation if something goes wrong
@@ -324,10 +465,38 @@ def compute_inputs_hash(
 
     # Sort keys for consistent hashing
     serialized = {k: _serialize(v, 0) for k, v in sorted(kwargs.items())}
-    json_str = json.dumps(serialized, sort_keys=True, default=str)
+    json_str = _KEY_ENCODER.encode(serialized)
     return hashlib.sha256(json_str.encode()).hexdigest()[:16]
 
 
+def compute_code_signature(fn: Any, dependency_depth: int = 2) -> Tuple[str, str]:
+    """Compute the input-independent parts of a node signature.
+
+    These only change when code changes, so callers can compute them once
+    per run and reuse them for every item.
+
+    Args:
+        fn: Function to hash
+        dependency_depth: How many levels of dependencies to track
+
+    Returns:
+        Tuple of (code_hash, deps_code_hash)
+    """
+    return compute_code_hash(fn), compute_deps_hash(fn, depth=dependency_depth)
+
+
+@lru_cache(maxsize=None)
+def _returns_status(fn: Any) -> bool:
+    """Whether fn is annotated to return bool or None (resolved once per fn)."""
+    try:
+        from typing import get_type_hints
+
+        ret = get_type_hints(fn).get("return", None)
+        return ret is bool or ret is type(None)
+    except Exception:
+        return False
+
+
 def compute_signature(
     node_name: str,
     fn: Any,
@@ -336,6 +505,7 @@ def compute_signature(
     env_hash: Optional[str] = None,
     dependency_depth: int = 2,
     serialization_depth: int = 2,
+    code_signature: Optional[Tuple[str, str]] = None,
 ) -> NodeSignature:
     """Compute complete signature for a node.
 
@@ -347,26 +517,21 @@ def compute_signature(
         env_hash: Optional environment hash override
         dependency_depth: How many levels of dependencies to track
         serialization_depth: How deep to serialize object attributes
+        code_signature: Precomputed result of compute_code_signature(fn)
 
     Returns:
         Complete NodeSignature
     """
     import time
 
-    code_hash = compute_code_hash(fn)
-    deps_code_hash = compute_deps_hash(fn, depth=dependency_depth)
+    if code_signature is None:
+        code_signature = compute_code_signature(fn, dependency_depth)
+    code_hash, deps_code_hash = code_signature
 
     # Heuristic: treat functions that return bool/None as potential side-effect nodes.
     # For such nodes, include object instance IDs (even when __cache_key__ exists)
     # to avoid skipping necessary initialization on new instances.
-    try:
-        from typing import get_type_hints
-
-        hints = get_type_hints(fn)
-        ret = hints.get("return", None)
-        force_ids = ret is bool or ret is type(None)
-    except Exception:
-        force_ids = False
+    force_ids = _returns_status(fn)
 
     inputs_hash = compute_inputs_hash(
         kwargs, serialization_depth=serialization_depth, force_instance_ids=force_ids
@@ -394,7 +559,11 @@ class CacheBackend(Protocol):
     """Protocol for cache backends that manage both metadata and blob storage."""
 
     def get_meta(self, node_name: str) -> Optional[NodeSignature]:
-        """Retrieve signature for a node."""
+        """Retrieve signature for a node.
+
+        Backends may also define ``get_meta_many(keys)`` returning a dict of
+        the found signatures; the runner uses it to prefetch a whole batch.
+        """
         ...
 
     def set_meta(self, signature: NodeSignature) -> None:
@@ -447,54 +616,113 @@ class _BlobStore(Protocol):
         ...
 
 
-class _JSONMetaStore:
-    """JSON file-based metadata store (internal)."""
+class _SQLiteMetaStore:
+    """SQLite-based metadata store (internal).
+
+    Each signature is one row, so storing a signature is a single indexed
+    upsert instead of rewriting every stored signature. Signatures from a
+    metadata.json written by earlier versions are imported on first open.
+    """
+
+    _COLUMNS = (
+        "node_name",
+        "code_hash",
+        "env_hash",
+        "inputs_hash",
+        "deps_hash",
+        "timestamp",
+    )
+    # Stay well under SQLite's limit on bound parameters per statement
+    _MAX_PARAMS = 500
 
     def __init__(self, cache_dir: str):
-        """Initialize JSON metadata store.
+        """Initialize SQLite metadata store.
 
         Args:
             cache_dir: Directory for cache storage
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.meta_file = self.cache_dir / "metadata.json"
-
-        # Load existing metadata
-        self._meta: Dict[str, Dict[str, Any]] = {}
-        if self.meta_file.exists():
-            try:
-                with open(self.meta_file, "r") as f:
-                    self._meta = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                self._meta = {}
+        self.db_file = self.cache_dir / "metadata.sqlite"
+        # Guards the shared connection (items may run in threads)
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        # WAL keeps readers unblocked by writes and makes commits cheap
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            "node_name TEXT PRIMARY KEY, code_hash TEXT, env_hash TEXT, "
+            "inputs_hash TEXT, deps_hash TEXT, timestamp REAL)"
+        )
+        self._conn.commit()
+        # Close the connection when the store is collected or the interpreter exits
+        self._finalizer = weakref.finalize(self, self._conn.close)
+        self._import_json(self.cache_dir / "metadata.json")
+
+    def _import_json(self, meta_file: Path) -> None:
+        """Move signatures from a legacy metadata.json into the database."""
+        if not meta_file.exists():
+            return
+        try:
+            with open(meta_file, "r") as f:
+                legacy = json.load(f)
+            rows = [tuple(data[c] for c in self._COLUMNS) for data in legacy.values()]
+        except (json.JSONDecodeError, OSError, KeyError, TypeError, AttributeError):
+            # Leave a file we could not read in place rather than lose it
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO meta VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        meta_file.unlink(missing_ok=True)
 
     def get(self, node_name: str) -> Optional[NodeSignature]:
         """Retrieve signature for a node."""
-        if node_name in self._meta:
-            data = self._meta[node_name]
-            return NodeSignature(**data)
-        return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM meta WHERE node_name = ?", (node_name,)
+            ).fetchone()
+        return NodeSignature(*row) if row is not None else None
+
+    def get_many(self, keys: List[str]) -> Dict[str, NodeSignature]:
+        """Retrieve signatures for several nodes (missing keys are omitted)."""
+        found: Dict[str, NodeSignature] = {}
+        with self._lock:
+            for start in range(0, len(keys), self._MAX_PARAMS):
+                chunk = keys[start : start + self._MAX_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT * FROM meta WHERE node_name IN ({placeholders})", chunk
+                ):
+                    found[row[0]] = NodeSignature(*row)
+        return found
 
     def set(self, signature: NodeSignature) -> None:
         """Store signature for a node."""
-        self._meta[signature.node_name] = {
-            "node_name": signature.node_name,
-            "code_hash": signature.code_hash,
-            "env_hash": signature.env_hash,
-            "inputs_hash": signature.inputs_hash,
-            "deps_hash": signature.deps_hash,
-            "timestamp": signature.timestamp,
-        }
-        # Persist to disk
-        with open(self.meta_file, "w") as f:
-            json.dump(self._meta, f, indent=2)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    signature.node_name,
+                    signature.code_hash,
+                    signature.env_hash,
+                    signature.inputs_hash,
+                    signature.deps_hash,
+                    signature.timestamp,
+                ),
+            )
 
     def clear(self) -> None:
         """Clear all stored signatures."""
-        self._meta = {}
-        if self.meta_file.exists():
-            self.meta_file.unlink()
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM meta")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._finalizer()
 
 
 class _DiskCacheBlobStore:
@@ -523,6 +751,10 @@ class _DiskCacheBlobStore:
         """Clear all stored outputs."""
         self.cache.clear()
 
+    def close(self) -> None:
+        """Close the underlying diskcache."""
+        self.cache.close()
+
 
 class MemoryCache:
     """In-memory cache backend - ephemeral storage for current session."""
@@ -536,6 +768,11 @@ class MemoryCache:
         """Retrieve signature for a node."""
         return self._meta.get(node_name)
 
+    def get_meta_many(self, keys: List[str]) -> Dict[str, NodeSignature]:
+        """Retrieve signatures for several nodes (missing keys are omitted)."""
+        meta = self._meta
+        return {key: meta[key] for key in keys if key in meta}
+
     def set_meta(self, signature: NodeSignature) -> None:
         """Store signature for a node."""
         self._meta[signature.node_name] = signature
@@ -564,13 +801,17 @@ class DiskCache:
             cache_dir: Directory for cache storage (default: .cache)
         """
         self.cache_dir = cache_dir
-        self._meta_store = _JSONMetaStore(cache_dir)
+        self._meta_store = _SQLiteMetaStore(cache_dir)
         self._blob_store = _DiskCacheBlobStore(cache_dir)
 
     def get_meta(self, node_name: str) -> Optional[NodeSignature]:
         """Retrieve signature for a node."""
         return self._meta_store.get(node_name)
 
+    def get_meta_many(self, keys: List[str]) -> Dict[str, NodeSignature]:
+        """Retrieve signatures for several nodes (missing keys are omitted)."""
+        return self._meta_store.get_many(keys)
+
     def set_meta(self, signature: NodeSignature) -> None:
         """Store signature for a node."""
         self._meta_store.set(signature)
@@ -588,6 +829,17 @@ class DiskCache:
         self._meta_store.clear()
         self._blob_store.clear()
 
+    def close(self) -> None:
+        """Close the metadata database and blob store."""
+        self._meta_store.close()
+        self._blob_store.close()
+
+    def __enter__(self) -> "DiskCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
 
 @dataclass
 class CacheConfig:
@@ -600,6 +852,11 @@ class CacheConfig:
     verbose: bool = True  # print cache status after each run
     per_item_caching: bool = True  # Enable per-item caching for map_axis nodes
     serialization_depth: int = 2  # depth for object attribute serialization
+    # Outputs a Runner keeps in memory so repeat hits skip loading blobs.
+    # Off by default: hits then share one object instead of a fresh copy.
+    memory_items: int = 0
+    # Receives each CacheEvent as it happens (works with verbose=False)
+    on_event: Optional[Callable[[CacheEvent], None]] = None
 
 
 # Legacy factory function - deprecated, use backend classes directly
@@ -650,7 +907,7 @@ def create_stores(
     else:
         # Old-style config with string backend
         cache_dir = getattr(config, "cache_dir", ".cache")
-        meta_store = _JSONMetaStore(cache_dir)
+        meta_store = _SQLiteMetaStore(cache_dir)
         blob_store = _DiskCacheBlobStore(cache_dir)
         return meta_store, blob_store
 
@@ -673,19 +930,30 @@ def signatures_match(sig1: NodeSignature, sig2: NodeSignature) -> bool:
     )
 
 
-def get_item_cache_key(item: Any, key_attr: Optional[str] = None) -> str:
+def get_item_cache_key(
+    item: Any,
+    key_attr: Optional[str] = None,
+    key_getter: Optional[Callable[[Any], Any]] = None,
+) -> str:
     """Extract cache key from an item for map_axis nodes.
 
     Args:
         item: The item being processed
         key_attr: Attribute name to use as unique identifier
+        key_getter: Prebuilt ``attrgetter(key_attr)``, used instead of key_attr
+            (NodeDef.key_getter, so the name is not resolved per item)
 
     Returns:
         String identifier for the item
     """
-    if key_attr and hasattr(item, key_attr):
-        return str(getattr(item, key_attr))
-    elif isinstance(item, BaseModel):
+    if key_getter is None and key_attr:
+        key_getter = attrgetter(key_attr)
+    if key_getter is not None:
+        try:
+            return str(key_getter(item))
+        except AttributeError:
+            pass
+    if isinstance(item, BaseModel):
         # For Pydantic models, try common ID fields
         for attr in ["id", "uuid", "key", "name"]:
             if hasattr(item, attr):
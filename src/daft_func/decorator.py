@@ -1,6 +1,7 @@
 """Decorator for defining DAG nodes."""
 
-from functools import wraps
+import types
+from functools import update_wrapper, wraps
 from typing import Callable, Optional
 
 from daft_func.pipeline import NodeMeta
@@ -14,6 +15,7 @@ def func(
     cache: bool = False,
     cache_key: Optional[str] = None,
     cache_backend: Optional[str] = None,
+    vectorized: bool = False,
 ):
     """Decorator to attach metadata to a function for DAG pipeline use.
 
@@ -24,6 +26,9 @@ def func(
         cache: Enable caching for this node
         cache_key: Optional environment hash override for cache invalidation
         cache_backend: Optional backend override (diskcache)
+        vectorized: In Daft batch mode, call the function once per batch with
+            numeric columns as NumPy arrays (other columns as lists) and expect
+            one result per row. Suits NumPy or Numba-compiled element-wise code.
 
     Example:
         @func(output="result", map_axis="query", key_attr="query_uuid", cache=True)
@@ -37,14 +42,33 @@ def func(
         cache=cache,
         cache_key=cache_key,
         cache_backend=cache_backend,
+        vectorized=vectorized,
     )
 
     def deco(fn: Callable):
-        @wraps(fn)
-        def wrapper(*args, **kwargs):
-            return fn(*args, **kwargs)
+        # Decorating again with the same metadata is a no-op
+        if getattr(fn, "_func_meta", None) == meta:
+            return fn
 
-        wrapper._func_meta = meta
-        return wrapper
+        if isinstance(fn, types.FunctionType):
+            # A copy sharing fn's code: each decoration is its own node, and
+            # node calls don't go through an extra wrapper frame
+            node_fn = types.FunctionType(
+                fn.__code__,
+                fn.__globals__,
+                fn.__name__,
+                fn.__defaults__,
+                fn.__closure__,
+            )
+            node_fn.__kwdefaults__ = fn.__kwdefaults__
+            update_wrapper(node_fn, fn)
+        else:
+            # Other callables (e.g. bound methods) get a pass-through wrapper
+            @wraps(fn)
+            def node_fn(*args, **kwargs):
+                return fn(*args, **kwargs)
+
+        node_fn._func_meta = meta
+        return node_fn
 
     return deco
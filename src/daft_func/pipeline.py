@@ -1,11 +1,25 @@
 """DAG pipeline for managing nodes and dependencies."""
 
+import heapq
 import inspect
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    get_type_hints,
+)
 
+from daft_func.types import TypeKind, classify_type
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class NodeMeta:
     """Metadata for a DAG node."""
 
@@ -18,9 +32,11 @@ class NodeMeta:
     cache: bool = False  # Enable caching for this node
     cache_key: Optional[str] = None  # Optional env_hash override
     cache_backend: Optional[str] = None  # Optional backend override (diskcache)
+    # Batch mode calls fn once per batch with whole columns instead of per row
+    vectorized: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeDef:
     """Definition of a DAG node including function, metadata, and parameters."""
 
@@ -28,6 +44,56 @@ class NodeDef:
     meta: NodeMeta
     params: Tuple[str, ...]  # ordered parameter names (from signature)
     params_with_defaults: Tuple[str, ...]  # parameters that have default values
+    # Resolved type hints, computed once at registration
+    hints: Dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+    # (TypeKind, model class) per annotated name, including "return"
+    kinds: Dict[str, Tuple[TypeKind, Optional[type]]] = field(
+        default_factory=dict, hash=False, compare=False
+    )
+    # Default value per defaulted parameter, read once at registration
+    defaults: Dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+    # Parameters passed to fn (excluding "self") and a getter for them
+    effective_params: Tuple[str, ...] = field(
+        init=False, repr=False, hash=False, compare=False
+    )
+    _getter: Optional[Callable] = field(
+        init=False, repr=False, hash=False, compare=False
+    )
+    # Reads meta.key_attr off a map_axis item (None without a key_attr)
+    key_getter: Optional[Callable] = field(
+        init=False, repr=False, hash=False, compare=False
+    )
+
+    def __post_init__(self):
+        effective = tuple(p for p in self.params if p != "self")
+        object.__setattr__(self, "effective_params", effective)
+        object.__setattr__(
+            self, "_getter", itemgetter(*effective) if len(effective) >= 2 else None
+        )
+        key_attr = self.meta.key_attr
+        object.__setattr__(
+            self, "key_getter", attrgetter(key_attr) if key_attr else None
+        )
+
+    def gather_kwargs(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """Pick this node's arguments out of the available values.
+
+        Args:
+            values: Mapping of available names to values
+
+        Returns:
+            Keyword arguments for fn (omitting unprovided defaulted params)
+        """
+        params = self.effective_params
+        try:
+            if self._getter is not None:
+                return dict(zip(params, self._getter(values)))
+            if params:
+                return {params[0]: values[params[0]]}
+            return {}
+        except KeyError:
+            # Some defaulted parameters were not provided
+            return {p: values[p] for p in params if p in values}
 
 
 class Pipeline:
@@ -46,6 +112,20 @@ class Pipeline:
         self.nodes: List[NodeDef] = []
         self.by_output: Dict[str, NodeDef] = {}
 
+        # Dependency tracking for topo: required (non-default) inputs per node
+        # (parallel to self.nodes) and the nodes requiring each name
+        self._required: List[Tuple[str, ...]] = []
+        self._consumers: Dict[str, List[int]] = {}
+        # Each name gets one bit, so a set of available names is one int key
+        self._name_bits: Dict[str, int] = {}
+        # Topo results keyed by (available-names mask, targets); order only
+        # depends on which names are present, not their values
+        self._topo_cache: Dict[Tuple[int, Optional[frozenset]], List[NodeDef]] = {}
+        # Straight-line runners built by compile, under the same keys
+        self._compiled: Dict[Tuple[int, Optional[frozenset]], Callable] = {}
+        # Rendered visualizations keyed by their (hashable) arguments
+        self._viz_cache: Dict[frozenset, Any] = {}
+
         if functions:
             for fn in functions:
                 meta = getattr(fn, "_func_meta", None)
@@ -60,22 +140,112 @@ class Pipeline:
         sig = inspect.signature(fn)
         params = tuple(sig.parameters.keys())
         # Track which parameters have default values
-        params_with_defaults = tuple(
-            name
+        defaults = {
+            name: param.default
             for name, param in sig.parameters.items()
             if param.default is not inspect.Parameter.empty
-        )
+        }
+        params_with_defaults = tuple(defaults)
+        try:
+            hints = get_type_hints(fn)
+        except Exception:
+            hints = {}
         node = NodeDef(
-            fn=fn, meta=meta, params=params, params_with_defaults=params_with_defaults
+            fn=fn,
+            meta=meta,
+            params=params,
+            params_with_defaults=params_with_defaults,
+            hints=hints,
+            defaults=defaults,
+            kinds={name: classify_type(tp) for name, tp in hints.items()},
         )
         self.nodes.append(node)
         self.by_output[meta.output_name] = node
 
-    def topo(self, initial_inputs: Dict[str, Any]) -> List[NodeDef]:
+        node_idx = len(self.nodes) - 1
+        required = tuple(
+            p for p in params if p != "self" and p not in params_with_defaults
+        )
+        self._required.append(required)
+        for p in required:
+            self._consumers.setdefault(p, []).append(node_idx)
+        # Defaulted params get bits too, so whether they are passed is part
+        # of the key compile caches under
+        for p in node.effective_params:
+            self._name_bit(p)
+        self._name_bit(meta.output_name)
+        self._topo_cache.clear()
+        self._compiled.clear()
+        self._viz_cache.clear()
+
+    def _name_bit(self, name: str) -> int:
+        """Return the bit assigned to a parameter/output name, assigning if new."""
+        bit = self._name_bits.get(name)
+        if bit is None:
+            bit = 1 << len(self._name_bits)
+            self._name_bits[name] = bit
+        return bit
+
+    def required_nodes(self, targets: Iterable[str]) -> List[int]:
+        """Find the nodes needed to produce the given outputs.
+
+        Walks the dependency graph backwards from the targets.
+
+        Args:
+            targets: Output names that must be computed
+
+        Returns:
+            Indices into self.nodes of the required nodes, in registration order
+
+        Raises:
+            ValueError: If a target is not produced by any node
+        """
+        index_of = {id(node): idx for idx, node in enumerate(self.nodes)}
+        needed = set()
+        stack = []
+        for target in targets:
+            if target not in self.by_output:
+                raise ValueError(f"Unknown target output: '{target}'")
+            stack.append(target)
+
+        while stack:
+            producer = self.by_output.get(stack.pop())
+            if producer is None:
+                continue  # provided as an input
+            idx = index_of[id(producer)]
+            if idx in needed:
+                continue
+            needed.add(idx)
+            stack.extend(producer.effective_params)
+
+        return sorted(needed)
+
+    def _cache_key(
+        self, initial_inputs: Iterable[str], targets: Optional[Iterable[str]]
+    ) -> Tuple[int, Optional[frozenset]]:
+        """Key topo and compile results by the names present and the targets."""
+        avail_mask = 0
+        for name in initial_inputs:
+            bit = self._name_bits.get(name)
+            if bit is not None:
+                avail_mask |= bit
+        return (avail_mask, None if targets is None else frozenset(targets))
+
+    def topo(
+        self,
+        initial_inputs: Dict[str, Any],
+        targets: Optional[Iterable[str]] = None,
+    ) -> List[NodeDef]:
         """Perform topological sort based on parameter availability.
 
+        Orders are cached per set of available names and targets, so calls
+        with the same input keys cost one cache lookup.
+
         Args:
-            initial_inputs: Dictionary of initially available values
+            initial_inputs: Dictionary of initially available values (only
+                the keys are used)
+            targets: Optional output names to compute; nodes not on a path to
+                a target are pruned. None keeps every node.
 
         Returns:
             List of nodes in execution order
@@ -83,49 +253,116 @@ class Pipeline:
         Raises:
             RuntimeError: If dependencies cannot be resolved (circular deps or missing inputs)
         """
-        available = set(initial_inputs.keys())
+        key = self._cache_key(initial_inputs, targets)
+        cached = self._topo_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        if targets is None:
+            candidates = range(len(self.nodes))
+        else:
+            candidates = self.required_nodes(targets)
+
+        # Kahn's algorithm over names. A node becomes ready once its last
+        # missing input is produced; nodes run in (pass, registration index)
+        # order, where a node joins the pass of its inputs' producers if
+        # registered after them and the next pass otherwise
+        missing: Dict[int, int] = {}
+        ready: List[Tuple[int, int]] = []
+        for idx in candidates:
+            count = sum(1 for p in self._required[idx] if p not in initial_inputs)
+            missing[idx] = count
+            if count == 0:
+                ready.append((0, idx))
+        heapq.heapify(ready)
+
+        # Earliest (pass, index) at which each produced name became available
+        produced_at: Dict[str, Tuple[int, int]] = {}
         ordered: List[NodeDef] = []
-        remaining = set(self.nodes)
-
-        while remaining:
-            progress = False
-            for node in list(remaining):
-                # Required parameters are those without defaults
-                required = {
-                    p
-                    for p in node.params
-                    if p not in ("self",) and p not in node.params_with_defaults
-                }
-                if required.issubset(available):
-                    ordered.append(node)
-                    available.add(node.meta.output_name)
-                    remaining.remove(node)
-                    progress = True
-            if not progress:
-                # Build detailed error message showing what's missing for each node
-                error_details = []
-                for node in remaining:
-                    required = {
-                        p
-                        for p in node.params
-                        if p not in ("self",) and p not in node.params_with_defaults
-                    }
-                    missing = required - available
-                    error_details.append(
-                        f"  - Function '{node.fn.__name__}' (output='{node.meta.output_name}') "
-                        f"is missing required inputs: {sorted(missing)}"
-                    )
+        while ready:
+            node_pass, idx = heapq.heappop(ready)
+            node = self.nodes[idx]
+            ordered.append(node)
+            name = node.meta.output_name
+            if name in produced_at or name in initial_inputs:
+                continue
+            produced_at[name] = (node_pass, idx)
+            for consumer in self._consumers.get(name, ()):
+                if consumer not in missing or missing[consumer] == 0:
+                    continue
+                missing[consumer] -= 1
+                if missing[consumer] == 0:
+                    consumer_pass = 0
+                    for p in self._required[consumer]:
+                        at = produced_at.get(p)
+                        if at is not None:
+                            p_pass = at[0] if at[1] < consumer else at[0] + 1
+                            consumer_pass = max(consumer_pass, p_pass)
+                    heapq.heappush(ready, (consumer_pass, consumer))
 
-                raise RuntimeError(
-                    "Cannot resolve pipeline dependencies. The following functions have missing inputs:\n"
-                    + "\n".join(error_details)
+        if len(ordered) < len(missing):
+            # Build detailed error message showing what's missing for each node
+            available = set(initial_inputs.keys())
+            available.update(node.meta.output_name for node in ordered)
+            error_details = []
+            for idx in candidates:
+                if missing[idx] == 0:
+                    continue
+                node = self.nodes[idx]
+                missing_inputs = set(self._required[idx]) - available
+                error_details.append(
+                    f"  - Function '{node.fn.__name__}' (output='{node.meta.output_name}') "
+                    f"is missing required inputs: {sorted(missing_inputs)}"
                 )
-        return ordered
+
+            raise RuntimeError(
+                "Cannot resolve pipeline dependencies. The following functions have missing inputs:\n"
+                + "\n".join(error_details)
+            )
+        self._topo_cache[key] = ordered
+        return list(ordered)
+
+    def compile(
+        self,
+        initial_inputs: Dict[str, Any],
+        targets: Optional[Iterable[str]] = None,
+    ) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+        """Build a function that runs the DAG as straight-line code.
+
+        The function takes inputs with the same names as initial_inputs and
+        returns the node outputs, calling each node with its arguments bound
+        directly instead of gathering kwargs from a mapping per node. Results
+        are cached like topo, so this is a lookup after the first call.
+
+        Args:
+            initial_inputs: Dictionary of initially available values (only
+                the keys are used)
+            targets: Optional output names to compute, as for topo
+
+        Returns:
+            Function mapping inputs to a dict of node outputs
+
+        Raises:
+            RuntimeError: If dependencies cannot be resolved
+        """
+        key = self._cache_key(initial_inputs, targets)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            order = self.topo(initial_inputs, targets)
+            compiled = _compile_order(order, initial_inputs)
+            self._compiled[key] = compiled
+        return compiled
 
     def clear(self):
         """Clear all registered nodes."""
         self.nodes.clear()
         self.by_output.clear()
+        self._required.clear()
+        self._consumers.clear()
+        self._name_bits.clear()
+        self._topo_cache.clear()
+        self._compiled.clear()
+        self._viz_cache.clear()
 
     def visualize(self, **kwargs):
         """Visualize the pipeline as a directed graph.
@@ -134,10 +371,77 @@ class Pipeline:
             **kwargs: Additional arguments passed to visualize_graphviz
                 (orient, style, figsize, filename, show_legend, return_type)
 
+        Renderings are memoized per set of arguments until nodes are added
+        or cleared. Calls that save to a file, or pass unhashable arguments
+        such as a style, always render.
+
         Returns:
             graphviz.Digraph or IPython.display.HTML object
         """
         from daft_func.visualization import build_graph, visualize_graphviz
 
-        graph = build_graph(self)
-        return visualize_graphviz(graph, **kwargs)
+        key = None
+        if kwargs.get("filename") is None:
+            try:
+                key = frozenset(kwargs.items())
+            except TypeError:
+                pass
+        cached = self._viz_cache.get(key) if key is not None else None
+        if cached is None:
+            cached = visualize_graphviz(build_graph(self), **kwargs)
+            if key is not None:
+                self._viz_cache[key] = cached
+        # Hand out copies of Digraphs so callers can't modify the cached one
+        return cached.copy() if hasattr(cached, "copy") else cached
+
+
+def _compile_order(
+    order: List[NodeDef], initial_inputs: Iterable[str]
+) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """Generate a straight-line runner for nodes in execution order.
+
+    Inputs are read once into locals and each node's output is bound to a new
+    local, so later nodes see the latest value of a name as they would when
+    gathering from outputs layered over inputs. Defaulted params that are
+    neither passed nor produced are left out of the call. For
+    ``hits = retrieve(query, top_k)`` and ``reranked = rerank(query, hits)``
+    this compiles::
+
+        def _run(inputs, _f0=retrieve, _f1=rerank):
+            v0 = inputs['query']
+            v1 = inputs['top_k']
+            v2 = _f0(query=v0, top_k=v1)
+            v3 = _f1(query=v0, hits=v2)
+            return {'hits': v2, 'reranked': v3}
+    """
+    initial = set(initial_inputs)
+    local: Dict[str, str] = {}
+    outputs: Dict[str, str] = {}
+    namespace: Dict[str, Any] = {}
+    lines: List[str] = []
+
+    def _new_local() -> str:
+        return f"v{len(lines)}"
+
+    for pos, node in enumerate(order):
+        args = []
+        for p in node.effective_params:
+            if p not in local:
+                if p not in initial:
+                    continue  # defaulted and not provided
+                local[p] = _new_local()
+                lines.append(f"    {local[p]} = inputs[{p!r}]")
+            args.append(f"{p}={local[p]}")
+        namespace[f"_f{pos}"] = node.fn
+        name = node.meta.output_name
+        local[name] = outputs[name] = _new_local()
+        lines.append(f"    {local[name]} = _f{pos}({', '.join(args)})")
+
+    result = ", ".join(f"{name!r}: {var}" for name, var in outputs.items())
+    lines.append(f"    return {{{result}}}")
+
+    # Bind node functions as defaults so calls are fast local lookups
+    params = ["inputs"] + [f"{key}={key}" for key in namespace]
+    source = f"def _run({', '.join(params)}):\n" + "\n".join(lines) + "\n"
+    exec(source, dict(namespace), namespace)
+    return namespace["_run"]
@@ -1,14 +1,33 @@
-"""Progress bar implementation with theme-aware multi-row display using tqdm."""
+"""Progress bar implementation with theme-aware multi-row display.
+
+Uses a single rich Progress display in terminals and tqdm widgets in Jupyter.
+"""
 
 import sys
-import warnings
+import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from tqdm import tqdm as _tqdm_cli
+from tqdm.notebook import tqdm as _tqdm_notebook
 
 from daft_func.theme import detect_theme, is_jupyter
 
-# Suppress tqdm experimental warnings for rich
-warnings.filterwarnings("ignore", message="rich is experimental/alpha")
+# Resolved once at import so repeated initialize_nodes calls skip the lookup
+try:
+    from rich.console import Console as _RichConsole
+    from rich.progress import (
+        BarColumn as _BarColumn,
+        MofNCompleteColumn as _MofNCompleteColumn,
+        Progress as _RichProgress,
+        TextColumn as _TextColumn,
+    )
+except ImportError:
+    _RichProgress = None
+
+# Synchronized output (DEC mode 2026): terminal presents redraws as one frame
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
 
 
 @dataclass
@@ -68,6 +87,34 @@ class ProgressConfig:
     theme: Optional[str] = None  # "dark", "light", or None for auto-detect
     show_cache_indicators: bool = True
     show_timing: bool = True
+    refresh_interval: float = 0.1  # minimum seconds between redraws of a bar
+
+
+class _RichTaskBar:
+    """tqdm-like handle for one node's row in a shared rich Progress display."""
+
+    def __init__(self, progress: Any, task_id: Any):
+        self._progress = progress
+        self._task_id = task_id
+        self.n = 0
+
+    def update(self, n: int = 1):
+        self.n += n
+        self._progress.update(self._task_id, completed=self.n)
+
+    def set_description(self, desc: str, refresh: bool = True):
+        self._progress.update(self._task_id, description=desc)
+
+    def set_postfix(self, postfix: Dict[str, Any], refresh: bool = True):
+        text = ", ".join(f"{k}={v}" for k, v in postfix.items())
+        self._progress.update(self._task_id, postfix=text)
+
+    def refresh(self):
+        # The shared Live display repaints all rows on its own schedule
+        pass
+
+    def close(self):
+        pass
 
 
 @dataclass
@@ -81,12 +128,22 @@ class NodeProgressBar:
     node_status: Dict[str, str] = field(default_factory=dict)
     node_cached: Dict[str, bool] = field(default_factory=dict)
     node_times: Dict[str, float] = field(default_factory=dict)
+    _last_refresh: Dict[str, float] = field(default_factory=dict)
+    _pending_delta: Dict[str, int] = field(default_factory=dict)
+    _desc_cache: Dict[Tuple[str, str, bool], str] = field(default_factory=dict)
+    _max_len: int = 20
     _started: bool = False
     _in_jupyter: bool = False
+    _sync_supported: bool = False
+    _live_progress: Optional[Any] = None  # shared rich Progress (CLI)
 
     def __post_init__(self):
         """Initialize tqdm variant based on environment."""
         self._in_jupyter = is_jupyter()
+        try:
+            self._sync_supported = not self._in_jupyter and sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            self._sync_supported = False
 
     def initialize_nodes(self, node_names: List[str], items_count: int = 1):
         """Initialize progress display with all nodes.
@@ -98,22 +155,34 @@ class NodeProgressBar:
         if not self.config.enabled or self._started:
             return
 
-        # Import appropriate tqdm variant
-        if self._in_jupyter:
-            from tqdm.notebook import tqdm
-        else:
-            try:
-                # Suppress experimental warning for tqdm.rich
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    from tqdm.rich import tqdm
-            except ImportError:
-                from tqdm import tqdm
+        # Jupyter uses tqdm.notebook widgets; the CLI renders every node as a
+        # row of one rich Progress, falling back to plain tqdm without rich
+        live_progress = None
+        tqdm = _tqdm_notebook if self._in_jupyter else _tqdm_cli
+        if not self._in_jupyter and _RichProgress is not None:
+            live_progress = _RichProgress(
+                _TextColumn("{task.description}"),
+                _BarColumn(
+                    complete_style=self.theme_colors.bar_complete,
+                    finished_style=self.theme_colors.bar_finished,
+                ),
+                _MofNCompleteColumn(),
+                _TextColumn("{task.fields[postfix]}"),
+                console=_RichConsole(file=sys.stdout),
+                refresh_per_second=1 / max(self.config.refresh_interval, 0.01),
+            )
+            # Live renders each frame in a single write already
+            self._sync_supported = False
 
         # Store items count for each node
         for node_name in node_names:
             self.items_per_node[node_name] = items_count
 
+        # Name column width is fixed for the lifetime of the display
+        if self.items_per_node:
+            self._max_len = max(map(len, self.items_per_node))
+        self._desc_cache.clear()
+
         # Create progress bar for each node
         for node_name in node_names:
             # Initial status
@@ -124,7 +193,10 @@ class NodeProgressBar:
             desc = self._format_description(node_name, "pending")
 
             # Different formatting for Jupyter vs CLI
-            if self._in_jupyter:
+            if live_progress is not None:
+                task_id = live_progress.add_task(desc, total=items_count, postfix="")
+                pbar = _RichTaskBar(live_progress, task_id)
+            elif self._in_jupyter:
                 # Jupyter: simpler format, let tqdm.notebook handle the display
                 pbar = tqdm(
                     total=items_count,
@@ -132,7 +204,7 @@ class NodeProgressBar:
                     leave=True,
                 )
             else:
-                # CLI: use tqdm.rich with custom format
+                # CLI without rich: plain tqdm with custom format
                 pbar = tqdm(
                     total=items_count,
                     desc=desc,
@@ -145,6 +217,10 @@ class NodeProgressBar:
 
             self.node_progress[node_name] = pbar
 
+        if live_progress is not None:
+            live_progress.start()
+            self._live_progress = live_progress
+
         self._started = True
 
     def _format_description(
@@ -160,6 +236,11 @@ class NodeProgressBar:
         Returns:
             Formatted description string
         """
+        key = (node_name, status, cached)
+        formatted = self._desc_cache.get(key)
+        if formatted is not None:
+            return formatted
+
         # Status icons - use consistent 2-character width
         if status == "completed":
             icon = "⚡" if cached else "✓"
@@ -168,20 +249,63 @@ class NodeProgressBar:
         else:  # pending
             icon = "⏸"
 
-        # Calculate max node name length for proper padding
-        if self.items_per_node:
-            max_len = max(len(name) for name in self.items_per_node.keys())
-        else:
-            max_len = 20
-
         # Add extra space to ensure proper alignment
         # Format: "icon name      " with consistent total width
         # Using 2 chars for icon, 1 space, then padded name
-        total_width = max_len + 2  # icon + space + name padding
+        total_width = self._max_len + 2  # icon + space + name padding
         formatted = f"{icon} {node_name}".ljust(total_width)
 
+        self._desc_cache[key] = formatted
         return formatted
 
+    def _flush(self, name: str, force: bool = False):
+        """Apply pending progress and redraw a bar, rate-limited per node.
+
+        Args:
+            name: Node name
+            force: Redraw even if the refresh interval has not elapsed
+        """
+        now = time.monotonic()
+        last = self._last_refresh.get(name)
+        if (
+            not force
+            and last is not None
+            and now - last < self.config.refresh_interval
+        ):
+            return
+
+        self._redraw([name])
+
+    def _redraw(self, names: List[str]):
+        """Apply pending progress and redraw bars as a single terminal frame.
+
+        Args:
+            names: Node names whose bars should be redrawn
+        """
+        now = time.monotonic()
+        self._begin_sync()
+        try:
+            for name in names:
+                pbar = self.node_progress[name]
+                delta = self._pending_delta.pop(name, 0)
+                if delta:
+                    pbar.update(delta)
+                pbar.refresh()
+                self._last_refresh[name] = now
+        finally:
+            self._end_sync()
+
+    def _begin_sync(self):
+        """Start a synchronized terminal update (CLI only)."""
+        if self._sync_supported:
+            sys.stdout.write(_SYNC_BEGIN)
+
+    def _end_sync(self):
+        """End a synchronized terminal update (CLI only)."""
+        if self._sync_supported:
+            sys.stdout.write(_SYNC_END)
+            sys.stdout.flush()
+
     def start_node(self, name: str):
         """Mark a node as currently executing.
 
@@ -194,12 +318,14 @@ class NodeProgressBar:
         if name in self.node_progress:
             self.node_status[name] = "executing"
             desc = self._format_description(name, "executing")
-            self.node_progress[name].set_description(desc)
-            self.node_progress[name].refresh()
+            self.node_progress[name].set_description(desc, refresh=False)
+            self._flush(name, force=True)
 
     def update_node_progress(self, name: str, completed: int, total: int):
         """Update progress for a node (for multi-item runs).
 
+        Updates are accumulated and only drawn once per refresh interval.
+
         Args:
             name: Node name
             completed: Number of items completed
@@ -209,11 +335,13 @@ class NodeProgressBar:
             return
 
         if name in self.node_progress:
-            # Update to current completion
-            current = self.node_progress[name].n
+            # Accumulate progress up to the current completion
+            current = self.node_progress[name].n + self._pending_delta.get(name, 0)
             if completed > current:
-                self.node_progress[name].update(completed - current)
-            self.node_progress[name].refresh()
+                self._pending_delta[name] = (
+                    self._pending_delta.get(name, 0) + completed - current
+                )
+            self._flush(name)
 
     def complete_node(
         self,
@@ -232,7 +360,8 @@ class NodeProgressBar:
             return
 
         if name in self.node_progress:
-            # Update to 100%
+            # Update to 100% (pending deltas are superseded)
+            self._pending_delta.pop(name, None)
             total = self.items_per_node.get(name, 1)
             current = self.node_progress[name].n
             if current < total:
@@ -245,7 +374,7 @@ class NodeProgressBar:
 
             # Update description with completion icon
             desc = self._format_description(name, "completed", cached)
-            self.node_progress[name].set_description(desc)
+            self.node_progress[name].set_description(desc, refresh=False)
 
             # Add timing/cache info as postfix
             postfix = {}
@@ -255,18 +384,23 @@ class NodeProgressBar:
                 postfix["time"] = f"{execution_time:.2f}s"
 
             if postfix:
-                self.node_progress[name].set_postfix(postfix)
+                self.node_progress[name].set_postfix(postfix, refresh=False)
 
-            self.node_progress[name].refresh()
+            self._flush(name, force=True)
 
     def stop(self):
         """Stop the progress display."""
         if not self._started:
             return
 
-        # Close all progress bars
+        # Draw any throttled updates, then close all progress bars
+        if self._pending_delta:
+            self._redraw(list(self._pending_delta))
         for pbar in self.node_progress.values():
             pbar.close()
+        if self._live_progress is not None:
+            self._live_progress.stop()
+            self._live_progress = None
 
         self._started = False
 
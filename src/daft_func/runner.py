@@ -1,22 +1,30 @@
 """Runner for executing DAG workflows with adaptive batching."""
 
+import threading
 import time
+from collections import ChainMap, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    FrozenSet,
+    Iterable,
     List,
     Optional,
-    get_args,
-    get_origin,
-    get_type_hints,
+    Tuple,
 )
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from daft_func.cache import (
     CacheConfig,
     CacheStats,
+    MemoryCache,
+    compute_code_signature,
     compute_signature,
     get_item_cache_key,
     make_cache_key,
@@ -24,10 +32,101 @@ from daft_func.cache import (
 )
 from daft_func.pipeline import Pipeline
 from daft_func.progress import ProgressConfig, create_progress_bar
-from daft_func.types import DAFT_AVAILABLE, daft_datatype
+from daft_func.types import (
+    DAFT_AVAILABLE,
+    TypeKind,
+    _import_daft,
+    daft_datatype,
+    pyarrow_datatype,
+)
 
-if DAFT_AVAILABLE:
+if TYPE_CHECKING:
     import daft
+    import pyarrow
+
+
+# Weight of the newest run in the auto-mode cost estimates
+_EWMA_ALPHA = 0.3
+
+
+def _ewma(previous: Optional[float], sample: float) -> float:
+    """Fold a new sample into an exponentially weighted moving average."""
+    if previous is None:
+        return sample
+    return previous + _EWMA_ALPHA * (sample - previous)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(py_type: Any) -> TypeAdapter:
+    """Return a cached TypeAdapter for a (possibly generic) type.
+
+    Validating or dumping a whole column through one adapter runs in a single
+    pydantic-core call instead of one Python-level call per row.
+    """
+    return TypeAdapter(py_type)
+
+
+@lru_cache(maxsize=None)
+def _return_dtype(return_type: Any) -> "daft.DataType":
+    """Infer (once per type) the Daft dtype for a node's return annotation."""
+    try:
+        return daft_datatype(return_type)
+    except Exception as e:
+        print(
+            f"Warning: Could not infer return dtype from {return_type}, falling back to python(): {e}"
+        )
+        return daft.DataType.python()
+
+
+def _typed_column_df(name: str, values: List[Any], py_type: Any):
+    """Build a one-column DataFrame with the Arrow type of py_type.
+
+    Converting against the known type skips Daft's schema inference over the
+    dumped values. Returns None when the type has no Arrow mapping, the
+    values don't fit it, or it contains maps (which read back as key-value
+    pairs rather than the dicts consumers expect), so the caller can fall
+    back to inference.
+    """
+    try:
+        arrow_type = pyarrow_datatype(py_type)
+        if _contains_map(arrow_type):
+            return None
+        column = pyarrow.array(values, type=arrow_type)
+    except (TypeError, pyarrow.ArrowException):
+        return None
+    return daft.from_arrow(pyarrow.table({name: column}))
+
+
+def _contains_map(arrow_type: "pyarrow.DataType") -> bool:
+    """Whether an Arrow type has a map type anywhere in its tree."""
+    if pyarrow.types.is_map(arrow_type):
+        return True
+    if pyarrow.types.is_struct(arrow_type):
+        return any(_contains_map(field.type) for field in arrow_type)
+    if pyarrow.types.is_list(arrow_type) or pyarrow.types.is_large_list(arrow_type):
+        return _contains_map(arrow_type.value_type)
+    return False
+
+
+_IDENTITY_KIND = (TypeKind.IDENTITY, None)
+
+
+def _deser_identity(value: Any, model_cls: Optional[type]) -> Any:
+    return value
+
+
+def _deser_model(value: Any, model_cls: type) -> Any:
+    return model_cls.model_validate(value)
+
+
+def _deser_list_model(value: Any, model_cls: type) -> Any:
+    if isinstance(value, list):
+        return [model_cls.model_validate(item) for item in value]
+    return value
+
+
+# Indexed by TypeKind
+_KIND_HANDLERS = (_deser_identity, _deser_model, _deser_list_model)
 
 
 class Runner:
@@ -36,7 +135,8 @@ class Runner:
     Supports three execution modes:
     - local: Pure Python, no Daft (loops over items manually)
     - daft: Forces Daft batch execution
-    - auto: Automatically chooses based on batch size threshold
+    - auto: Chooses based on batch size threshold, then on measured cost
+      once both local and Daft runs have been observed
     """
 
     def __init__(
@@ -46,6 +146,8 @@ class Runner:
         batch_threshold: int = 2,
         cache_config: Optional[CacheConfig] = None,
         progress_config: Optional[ProgressConfig] = None,
+        local_parallelism: int = 1,
+        node_parallelism: int = 1,
     ):
         """Initialize runner with pipeline, execution mode and batch threshold.
 
@@ -55,40 +157,88 @@ class Runner:
             batch_threshold: Minimum number of items to trigger Daft batching in auto mode
             cache_config: Optional caching configuration
             progress_config: Optional progress bar configuration
+            local_parallelism: Number of threads used to process items in local
+                mode (useful when nodes do I/O or release the GIL)
+            node_parallelism: Number of threads used to run independent nodes
+                of one item concurrently. Applies when caching is off, since
+                cache signatures depend on the order nodes finish in.
         """
         self.pipeline = pipeline
         self.mode = mode
         self.batch_threshold = batch_threshold
         self.cache_config = cache_config or CacheConfig()
         self.progress_config = progress_config or ProgressConfig()
+        self.local_parallelism = max(1, local_parallelism)
+        self.node_parallelism = max(1, node_parallelism)
 
         # Get cache backend (always available, even if caching disabled)
         self.cache_backend = self.cache_config.backend
 
-        # Track signatures for current run
+        # Signatures of the most recently executed item
         self._current_signatures: Dict[str, str] = {}
 
+        # Code/dependency hashes per node function, computed once per run
+        self._code_signatures: Dict[Any, Tuple[str, str]] = {}
+
+        # Outputs recently loaded or stored, keyed by (cache key, signature)
+        # so repeat hits in this process skip loading the blob
+        self._recent_outputs: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+        # Stored signatures fetched up front for a local loop (None: no prefetch)
+        self._meta_prefetch: Optional[Dict[str, Any]] = None
+
         # Track cache statistics
         self._cache_stats: Optional[CacheStats] = None
 
         # Progress bar (created per run)
         self._progress_bar = None
 
-    def run(self, *, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        # Requested outputs for the current run (None runs every node)
+        self._targets: Optional[FrozenSet[str]] = None
+        # Whether batch outputs are rebuilt as models for the current run
+        self._validate_output = True
+
+        # Measured costs (seconds) for auto mode, smoothed across runs
+        self._local_item_cost: Optional[float] = None
+        self._daft_item_cost: Optional[float] = None
+        self._daft_startup_cost: Optional[float] = None
+        # Time spent inside batch UDF bodies during the current run
+        self._udf_seconds: List[float] = []
+
+    def run(
+        self,
+        *,
+        inputs: Dict[str, Any],
+        targets: Optional[Iterable[str]] = None,
+        validate_output: bool = True,
+    ) -> Dict[str, Any]:
         """Execute the DAG given initial inputs.
 
         Args:
             inputs: Dictionary of input values including the map_axis (if applicable)
+            targets: Optional output names to compute. Only nodes on a path to
+                a target run, and multi-item runs return every target.
+            validate_output: In Daft batch mode, rebuild Pydantic model outputs
+                stored as Arrow structs. False returns those as dicts, skipping
+                one validation per value (outputs kept as Python objects are
+                returned as models either way).
 
         Returns:
             Dictionary containing all outputs including final results
         """
         # Reset signatures for this run
         self._current_signatures = {}
-
-        # Initialize cache stats if verbose logging enabled
-        if self.cache_config.enabled and self.cache_config.verbose:
-            self._cache_stats = CacheStats()
+        self._code_signatures = {}
+        self._targets = frozenset(targets) if targets is not None else None
+        self._validate_output = validate_output
+
+        # Collect cache stats when they are printed or sent to a callback
+        cache_config = self.cache_config
+        if cache_config.enabled and (
+            cache_config.verbose or cache_config.on_event is not None
+        ):
+            self._cache_stats = CacheStats(on_event=cache_config.on_event)
         else:
             self._cache_stats = None
 
@@ -112,16 +262,12 @@ class Runner:
         elif self.mode == "daft":
             batching = True
         else:  # auto mode
-            batching = (
-                batching_requested and items_count >= self.batch_threshold
-                if map_axis
-                else False
-            )
+            batching = self._choose_batching(batching_requested, items_count)
 
         # Initialize progress bar with all nodes
         # Get topological order to show nodes in execution order
         try:
-            order = pipeline.topo(inputs)
+            order = pipeline.topo(inputs, self._targets)
             node_names = [node.meta.output_name for node in order]
 
             # Create and initialize progress bar
@@ -132,6 +278,8 @@ class Runner:
             # If topo fails, we'll let the actual execution handle the error
             pass
 
+        self._udf_seconds = []
+        run_start_ns = time.perf_counter_ns()
         try:
             # Execute based on strategy
             if batching:
@@ -147,31 +295,122 @@ class Runner:
             if self._progress_bar:
                 self._progress_bar.stop()
 
+        elapsed = (time.perf_counter_ns() - run_start_ns) * 1e-9
+        self._record_cost(batching, items_count, elapsed)
+
         # Print cache summary if enabled
-        if self._cache_stats:
+        if self._cache_stats and self.cache_config.verbose:
             self._cache_stats.print_summary()
 
         return result
 
-    def _run_single(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute DAG for a single item using pure Python."""
+    def _choose_batching(self, batching_requested: bool, items_count: int) -> bool:
+        """Decide whether auto mode should run a list input through Daft.
+
+        Until both local and Daft runs have been measured the static
+        batch_threshold applies. Afterwards the mode with the lower predicted
+        wall time wins: items * local cost versus Daft startup + items * Daft
+        per-item cost. A single item always runs locally.
+        """
+        if not batching_requested or items_count <= 1:
+            return False
+        if (
+            self._local_item_cost is None
+            or self._daft_item_cost is None
+            or self._daft_startup_cost is None
+        ):
+            return items_count >= self.batch_threshold
+        predict_local = items_count * self._local_item_cost
+        predict_daft = self._daft_startup_cost + items_count * self._daft_item_cost
+        return predict_daft < predict_local
+
+    def _record_cost(self, batching: bool, items_count: int, elapsed: float) -> None:
+        """Update the auto-mode cost estimates from a finished run.
+
+        Args:
+            batching: Whether the run went through Daft
+            items_count: Number of items processed
+            elapsed: Wall time of the run in seconds
+        """
+        count = max(items_count, 1)
+        if not batching or not DAFT_AVAILABLE:
+            self._local_item_cost = _ewma(self._local_item_cost, elapsed / count)
+            return
+        # Time outside the UDF bodies is treated as fixed Daft overhead
+        udf_time = min(sum(self._udf_seconds), elapsed)
+        self._daft_item_cost = _ewma(self._daft_item_cost, udf_time / count)
+        self._daft_startup_cost = _ewma(self._daft_startup_cost, elapsed - udf_time)
+
+    def _run_single(
+        self,
+        inputs: Dict[str, Any],
+        track_progress: bool = True,
+        outputs_only: bool = False,
+        order: Optional[List[Any]] = None,
+    ) -> Dict[str, Any]:
+        """Execute DAG for a single item using pure Python.
+
+        Args:
+            inputs: Input values for one item
+            track_progress: Whether to report per-node progress (the local loop
+                reports progress itself)
+            outputs_only: Return only node outputs, without merging in inputs
+            order: Precomputed execution order (computed from inputs if None)
+
+        Returns:
+            Inputs merged with node outputs (or node outputs only)
+        """
         pipeline = self.pipeline
-        outputs = dict(inputs)
-        order = pipeline.topo(inputs)
+        # Node outputs overlay the inputs without copying them
+        node_outputs: Dict[str, Any] = {}
+        outputs = ChainMap(node_outputs, inputs)
+
+        # Per-call state so items can run concurrently
+        signatures: Dict[str, str] = {}
+        self._current_signatures = signatures
+        progress_bar = self._progress_bar if track_progress else None
+
+        # Loop-invariant lookups hoisted out of the per-node body
+        cache_config = self.cache_config
+        cache_backend = self.cache_backend
+        cache_stats = self._cache_stats
+        code_signatures = self._code_signatures
+        meta_prefetch = self._meta_prefetch
+        caching = cache_config.enabled and cache_backend is not None
+
+        # Fast path: nothing to cache, record or report, so run the DAG as
+        # straight-line code compiled for these input names
+        if (
+            not caching
+            and cache_stats is None
+            and progress_bar is None
+            and self.node_parallelism == 1
+        ):
+            node_outputs = pipeline.compile(inputs, self._targets)(inputs)
+            if outputs_only:
+                return node_outputs
+            return {**inputs, **node_outputs}
+
+        if order is None:
+            order = pipeline.topo(inputs, self._targets)
+
+        if not caching and cache_stats is None and self.node_parallelism > 1:
+            node_outputs = self._run_nodes_parallel(order, inputs, progress_bar)
+            if outputs_only:
+                return node_outputs
+            return {**inputs, **node_outputs}
 
         for node in order:
-            kwargs = {p: outputs[p] for p in node.params if p in outputs}
+            meta = node.meta
+            output_name = meta.output_name
+            kwargs = node.gather_kwargs(outputs)
 
             # Check if caching is enabled for this node
-            use_cache = (
-                self.cache_config.enabled
-                and node.meta.cache
-                and self.cache_backend is not None
-            )
+            use_cache = caching and meta.cache
 
             # Start progress tracking for this node
-            if self._progress_bar:
-                self._progress_bar.start_node(node.meta.output_name)
+            if progress_bar:
+                progress_bar.start_node(output_name)
 
             cached_result = False
 
@@ -179,47 +418,57 @@ class Runner:
                 # Determine if this is a map_axis node and get item key
                 item_key = None
                 if (
-                    node.meta.map_axis
-                    and self.cache_config.per_item_caching
-                    and node.meta.map_axis in kwargs
+                    meta.map_axis
+                    and cache_config.per_item_caching
+                    and meta.map_axis in kwargs
                 ):
-                    item = kwargs[node.meta.map_axis]
-                    item_key = get_item_cache_key(item, node.meta.key_attr)
+                    item = kwargs[meta.map_axis]
+                    item_key = get_item_cache_key(item, key_getter=node.key_getter)
 
                 # Build cache key (includes item key for map_axis nodes)
-                cache_key = make_cache_key(node.meta.output_name, item_key)
+                cache_key = make_cache_key(output_name, item_key)
+
+                # Code hashes don't depend on the item, so reuse them in a run
+                code_sig = code_signatures.get(node.fn)
+                if code_sig is None:
+                    code_sig = compute_code_signature(
+                        node.fn, cache_config.dependency_depth
+                    )
+                    code_signatures[node.fn] = code_sig
+
+                env_hash = meta.cache_key or cache_config.env_hash
+                if meta_prefetch is not None:
+                    stored_sig = meta_prefetch.get(cache_key)
+                else:
+                    stored_sig = cache_backend.get_meta(cache_key)
 
-                # Compute signature for this node
-                env_hash = node.meta.cache_key or self.cache_config.env_hash
+                # Computed on a miss too: it is written back to the store
                 new_sig = compute_signature(
                     node_name=cache_key,  # Use extended key for per-item caching
                     fn=node.fn,
                     kwargs=kwargs,
-                    parent_sigs=self._current_signatures,
+                    parent_sigs=signatures,
                     env_hash=env_hash,
-                    dependency_depth=self.cache_config.dependency_depth,
-                    serialization_depth=self.cache_config.serialization_depth,
+                    dependency_depth=cache_config.dependency_depth,
+                    serialization_depth=cache_config.serialization_depth,
+                    code_signature=code_sig,
                 )
-
-                # Check for cache hit
-                stored_sig = self.cache_backend.get_meta(cache_key)
                 cache_hit = stored_sig is not None and signatures_match(
                     new_sig, stored_sig
                 )
 
                 if cache_hit:
                     # Cache hit - try to load from blob store
-                    cached_value = self.cache_backend.get_blob(cache_key)
+                    cached_value = self._load_output(cache_key, new_sig.combined)
                     if cached_value is not None:
-                        outputs[node.meta.output_name] = cached_value
+                        outputs[output_name] = cached_value
                         # Store signature for downstream nodes
-                        sig_str = f"{new_sig.code_hash}{new_sig.env_hash}{new_sig.inputs_hash}{new_sig.deps_hash}"
-                        self._current_signatures[node.meta.output_name] = sig_str
+                        signatures[output_name] = new_sig.combined
 
                         # Record cache hit event
-                        if self._cache_stats:
-                            self._cache_stats.record(
-                                node_name=node.meta.output_name,
+                        if cache_stats:
+                            cache_stats.record(
+                                node_name=output_name,
                                 cache_enabled=True,
                                 cache_hit=True,
                                 loaded=True,
@@ -230,32 +479,34 @@ class Runner:
                         execution_time = 0.0
 
                         # Complete progress for this node
-                        if self._progress_bar:
-                            self._progress_bar.complete_node(
-                                node.meta.output_name,
+                        if progress_bar:
+                            progress_bar.complete_node(
+                                output_name,
                                 execution_time=execution_time,
                                 cached=True,
                             )
                         continue
 
                 # Cache miss or failed to load - execute node
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 res = node.fn(**kwargs)
-                execution_time = time.time() - start_time
-                outputs[node.meta.output_name] = res
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                outputs[output_name] = res
 
                 # Save to cache
-                self.cache_backend.set_blob(cache_key, res)
-                self.cache_backend.set_meta(new_sig)
+                cache_backend.set_blob(cache_key, res)
+                self._remember_output((cache_key, new_sig.combined), res)
+                cache_backend.set_meta(new_sig)
+                if meta_prefetch is not None:
+                    meta_prefetch[cache_key] = new_sig
 
                 # Store signature for downstream nodes
-                sig_str = f"{new_sig.code_hash}{new_sig.env_hash}{new_sig.inputs_hash}{new_sig.deps_hash}"
-                self._current_signatures[node.meta.output_name] = sig_str
+                signatures[output_name] = new_sig.combined
 
                 # Record cache miss event
-                if self._cache_stats:
-                    self._cache_stats.record(
-                        node_name=node.meta.output_name,
+                if cache_stats:
+                    cache_stats.record(
+                        node_name=output_name,
                         cache_enabled=True,
                         cache_hit=False,
                         loaded=False,
@@ -263,15 +514,15 @@ class Runner:
                     )
             else:
                 # No caching - just execute
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
                 res = node.fn(**kwargs)
-                execution_time = time.time() - start_time
-                outputs[node.meta.output_name] = res
+                execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+                outputs[output_name] = res
 
                 # Record no-cache event
-                if self._cache_stats:
-                    self._cache_stats.record(
-                        node_name=node.meta.output_name,
+                if cache_stats:
+                    cache_stats.record(
+                        node_name=output_name,
                         cache_enabled=False,
                         cache_hit=False,
                         loaded=False,
@@ -279,14 +530,121 @@ class Runner:
                     )
 
             # Complete progress for this node (if not already done for cache hit)
-            if self._progress_bar and not cached_result:
-                self._progress_bar.complete_node(
-                    node.meta.output_name,
+            if progress_bar and not cached_result:
+                progress_bar.complete_node(
+                    output_name,
                     execution_time=execution_time,
                     cached=False,
                 )
 
-        return outputs
+        if outputs_only:
+            return node_outputs
+        return {**inputs, **node_outputs}
+
+    def _load_output(self, cache_key: str, signature: str) -> Optional[Any]:
+        """Return a cached output, from memory when it was seen recently."""
+        key = (cache_key, signature)
+        recent = self._recent_outputs
+        with self._recent_lock:
+            value = recent.get(key)
+            if value is not None:
+                recent.move_to_end(key)
+                return value
+        value = self.cache_backend.get_blob(cache_key)
+        if value is not None:
+            self._remember_output(key, value)
+        return value
+
+    def _remember_output(self, key: Tuple[str, str], value: Any) -> None:
+        """Keep an output in memory, evicting the least recently used."""
+        limit = self.cache_config.memory_items
+        # A MemoryCache already hands back the stored object
+        if limit <= 0 or isinstance(self.cache_backend, MemoryCache):
+            return
+        recent = self._recent_outputs
+        with self._recent_lock:
+            recent[key] = value
+            recent.move_to_end(key)
+            while len(recent) > limit:
+                recent.popitem(last=False)
+
+    def _run_nodes_parallel(
+        self, order: List[Any], inputs: Dict[str, Any], progress_bar: Any
+    ) -> Dict[str, Any]:
+        """Run one item's nodes on a thread pool as their inputs become ready.
+
+        Each node reads the output of the latest node before it in order that
+        produces a name (or the input), so results match a sequential run.
+        Progress is reported from this thread as each submission finishes.
+        """
+        # Position in order of the node producing each argument, per node
+        sources: List[Dict[str, int]] = []
+        latest: Dict[str, int] = {}
+        for pos, node in enumerate(order):
+            sources.append(
+                {p: latest[p] for p in node.effective_params if p in latest}
+            )
+            latest[node.meta.output_name] = pos
+
+        waiting = [len(set(src.values())) for src in sources]
+        dependents: List[List[int]] = [[] for _ in order]
+        for pos, src in enumerate(sources):
+            for producer in set(src.values()):
+                dependents[producer].append(pos)
+
+        # A node whose only dependent waits on nothing else continues into
+        # it on the same worker, so chains cost one submission
+        chain_next: List[Optional[int]] = [
+            deps[0] if len(deps) == 1 and waiting[deps[0]] == 1 else None
+            for deps in dependents
+        ]
+
+        results: Dict[int, Any] = {}
+
+        def _call(pos: Optional[int]) -> List[Tuple[int, float]]:
+            timings = []
+            while pos is not None:
+                node = order[pos]
+                kwargs = node.gather_kwargs(inputs)
+                for name, producer in sources[pos].items():
+                    kwargs[name] = results[producer]
+                start_ns = time.perf_counter_ns()
+                results[pos] = node.fn(**kwargs)
+                timings.append((pos, (time.perf_counter_ns() - start_ns) * 1e-9))
+                pos = chain_next[pos]
+            return timings
+
+        with ThreadPoolExecutor(max_workers=self.node_parallelism) as executor:
+            running = {}
+            for pos, count in enumerate(waiting):
+                if count == 0:
+                    running[executor.submit(_call, pos)] = pos
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    try:
+                        timings = future.result()
+                    except BaseException:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+                    if progress_bar:
+                        for pos, execution_time in timings:
+                            name = order[pos].meta.output_name
+                            progress_bar.start_node(name)
+                            progress_bar.complete_node(
+                                name, execution_time=execution_time, cached=False
+                            )
+                    # Earlier chain members' only dependent already ran
+                    for dependent in dependents[timings[-1][0]]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            running[executor.submit(_call, dependent)] = dependent
+
+        return {
+            order[pos].meta.output_name: results[pos] for pos in range(len(order))
+        }
 
     def _run_local_loop(
         self, inputs: Dict[str, Any], map_axis: Optional[str]
@@ -296,75 +654,159 @@ class Runner:
 
         items = inputs[map_axis]
         constants = {k: v for k, v in inputs.items() if k != map_axis}
-        aggregated: List[Dict[str, Any]] = []
 
         # Track total execution time per node
         node_times: Dict[str, float] = {}
         node_cache_hits: Dict[str, int] = {}
 
-        # Get node order
+        # Get node order (topo only looks at which names are present, and the
+        # per-item inputs have the same names as the batch inputs)
         pipeline = self.pipeline
-        order = pipeline.topo({**constants, map_axis: items[0]})
-
-        for item_idx, it in enumerate(items):
-            # Reset signatures for each item
-            self._current_signatures = {}
-            per_inputs = {**constants, map_axis: it}
+        order = pipeline.topo(inputs, self._targets)
+
+        # Only the requested outputs (default: the last node's) are surfaced,
+        # so intermediate per-item outputs are released as each item finishes.
+        # Outputs that don't depend on the map axis, directly or through
+        # earlier nodes, are the same for every item: like batch mode, they
+        # are returned once rather than as per-item lists.
+        per_item = {map_axis}
+        for node in order:
+            if node.meta.map_axis is not None or not per_item.isdisjoint(
+                node.params
+            ):
+                per_item.add(node.meta.output_name)
+        surfaced = self._surfaced_outputs(order)
+        collected: Dict[str, List[Any]] = {
+            name: [] for name in surfaced if name in per_item
+        }
+        unmapped = [name for name in surfaced if name not in per_item]
+        shared: Dict[str, Any] = {}
+
+        def _run_item(it: Any) -> Tuple[Dict[str, Any], float]:
+            # Progress is reported by the caller as each item completes
+            item_start_ns = time.perf_counter_ns()
+            per_out = self._run_single(
+                {**constants, map_axis: it},
+                track_progress=False,
+                outputs_only=True,
+                order=order,
+            )
+            return per_out, (time.perf_counter_ns() - item_start_ns) * 1e-9
+
+        def _collect(results) -> None:
+            # Results arrive in item order; progress updates stay on this thread
+            for item_idx, (per_out, item_time) in enumerate(results):
+                if item_idx == 0:
+                    shared.update((name, per_out[name]) for name in unmapped)
+                for name, values in collected.items():
+                    values.append(per_out[name])
+                self._update_loop_progress(
+                    order, item_idx, len(items), item_time, node_times, node_cache_hits
+                )
 
-            # Temporarily disable progress bar for inner _run_single
-            # We'll handle progress updates manually here
-            saved_progress = self._progress_bar
-            self._progress_bar = None
+        # Fetch every stored signature the loop will look up in one call
+        self._meta_prefetch = self._prefetch_meta(order, items)
+        try:
+            if self.local_parallelism > 1 and len(items) > 1:
+                with ThreadPoolExecutor(max_workers=self.local_parallelism) as executor:
+                    _collect(executor.map(_run_item, items))
+            else:
+                _collect(map(_run_item, items))
+        finally:
+            self._meta_prefetch = None
 
-            item_start_time = time.time()
-            per_out = self._run_single(per_inputs)
-            aggregated.append(per_out)
+        # Merge structure: final outputs to lists
+        merged: Dict[str, Any] = dict(constants)
+        merged.update(shared)
+        merged.update(collected)
 
-            # Restore progress bar
-            self._progress_bar = saved_progress
+        return merged
 
-            # Update progress for each node after processing this item
-            if self._progress_bar:
-                for node_idx, node in enumerate(order):
-                    node_name = node.meta.output_name
+    def _prefetch_meta(
+        self, order: List[Any], items: List[Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch stored signatures for every (item, cached node) key at once.
 
-                    # On first item, mark node as executing
-                    if item_idx == 0:
-                        self._progress_bar.start_node(node_name)
+        Returns None when caching is off or the backend has no
+        ``get_meta_many``, in which case signatures are looked up per node.
+        """
+        cache_config = self.cache_config
+        get_meta_many = getattr(self.cache_backend, "get_meta_many", None)
+        if not cache_config.enabled or get_meta_many is None:
+            return None
 
-                    # Update progress (this shows the item count progressing)
-                    self._progress_bar.update_node_progress(
-                        node_name,
-                        completed=item_idx + 1,
-                        total=len(items),
+        keys: List[str] = []
+        for node in order:
+            meta = node.meta
+            if not meta.cache:
+                continue
+            # Mirrors the cache key derivation in _run_single
+            if (
+                meta.map_axis
+                and cache_config.per_item_caching
+                and meta.map_axis in node.params
+            ):
+                keys.extend(
+                    make_cache_key(
+                        meta.output_name,
+                        get_item_cache_key(it, key_getter=node.key_getter),
                     )
+                    for it in items
+                )
+            else:
+                keys.append(make_cache_key(meta.output_name))
+        if not keys:
+            return None
+        return get_meta_many(keys)
+
+    def _surfaced_outputs(self, order: List[Any]) -> List[str]:
+        """Output names returned per item by multi-item runs."""
+        if self._targets is not None:
+            return [
+                n.meta.output_name for n in order if n.meta.output_name in self._targets
+            ]
+        return [order[-1].meta.output_name] if order else []
+
+    def _update_loop_progress(
+        self,
+        order: List[Any],
+        item_idx: int,
+        total: int,
+        item_time: float,
+        node_times: Dict[str, float],
+        node_cache_hits: Dict[str, int],
+    ):
+        """Report local-loop progress for every node after one item completes."""
+        if self._progress_bar:
+            for node in order:
+                node_name = node.meta.output_name
+
+                # On first item, mark node as executing
+                if item_idx == 0:
+                    self._progress_bar.start_node(node_name)
+
+                # Update progress (this shows the item count progressing)
+                self._progress_bar.update_node_progress(
+                    node_name,
+                    completed=item_idx + 1,
+                    total=total,
+                )
 
-                    # On last item, complete the node
-                    if item_idx == len(items) - 1:
-                        # Estimate average time per node (rough approximation)
-                        avg_time = (
-                            (time.time() - item_start_time) / len(order) if order else 0
-                        )
-                        node_times[node_name] = node_times.get(node_name, 0) + avg_time
-
-                        # Check if any cache hits occurred
-                        has_cache_hits = node_cache_hits.get(node_name, 0) > 0
-
-                        # Complete the node
-                        self._progress_bar.complete_node(
-                            node_name,
-                            execution_time=node_times[node_name],
-                            cached=has_cache_hits,
-                        )
-
-        # Merge structure: final outputs to lists
-        final_output_name = order[-1].meta.output_name if order else None
+                # On last item, complete the node
+                if item_idx == total - 1:
+                    # Estimate average time per node (rough approximation)
+                    avg_time = item_time / len(order) if order else 0
+                    node_times[node_name] = node_times.get(node_name, 0) + avg_time
 
-        merged: Dict[str, Any] = dict(constants)
-        if final_output_name:
-            merged[final_output_name] = [o[final_output_name] for o in aggregated]
+                    # Check if any cache hits occurred
+                    has_cache_hits = node_cache_hits.get(node_name, 0) > 0
 
-        return merged
+                    # Complete the node
+                    self._progress_bar.complete_node(
+                        node_name,
+                        execution_time=node_times[node_name],
+                        cached=has_cache_hits,
+                    )
 
     def _run_batch(
         self, inputs: Dict[str, Any], map_axis: Optional[str]
@@ -378,189 +820,495 @@ class Runner:
         if not DAFT_AVAILABLE:
             # Fallback to Python loop
             return self._run_local_loop(inputs, map_axis)
-
-        # Build initial Daft DF with one column for the map_axis (dictified Pydantic)
-        df = daft.from_pylist([{map_axis: it.model_dump()} for it in items])
+        _import_daft(globals())
 
         pipeline = self.pipeline
-        order = pipeline.topo({**constants, map_axis: items[0]})
+        # Same names as a single item's inputs, so this hits the topo cache
+        order = pipeline.topo(inputs, self._targets)
 
         # First pass: execute non-mapped functions once and add to constants
         # (These are functions without a map_axis that don't depend on mapped data)
         for node in order:
             if node.meta.map_axis is None:
                 # This is a non-mapped function - execute it once
-                kwargs = {p: constants[p] for p in node.params if p in constants}
+                kwargs = node.gather_kwargs(constants)
                 result = node.fn(**kwargs)
                 constants[node.meta.output_name] = result
 
         # Second pass: process only mapped functions in batch
         mapped_nodes = [n for n in order if n.meta.map_axis is not None]
 
-        # We'll iteratively add columns to df for each mapped node's output
-        for node in mapped_nodes:
-            arg_names = node.params
-            series_args: List[Any] = []
-            deserializers: List[Callable[[Dict], Any]] = []
-
-            # Figure out types from hints (for Pydantic reconstruction)
-            hints = get_type_hints(node.fn)
-
-            def _mk_deser(py_type):
-                """Create deserializer for a given type, handling Pydantic models and lists."""
-                origin = get_origin(py_type)
-                if origin is list:
-                    args = get_args(py_type)
-                    if args:
-                        inner_type = args[0]
-                        try:
-                            if isinstance(inner_type, type) and issubclass(
-                                inner_type, BaseModel
-                            ):
-                                return (
-                                    lambda d, t=inner_type: [
-                                        t.model_validate(item) for item in d
-                                    ]
-                                    if isinstance(d, list)
-                                    else d
-                                )
-                        except Exception:
-                            pass
-
-                # Handle BaseModel types
-                try:
-                    if isinstance(py_type, type) and issubclass(py_type, BaseModel):
-                        return lambda d, t=py_type: t.model_validate(d)
-                except Exception:
-                    pass
-
-                return lambda x: x
-
-            for name in arg_names:
-                if name == node.meta.map_axis:
-                    series_args.append(df[map_axis])
-                    deserializers.append(_mk_deser(hints.get(name, Any)))
-                elif name in constants:
-                    series_args.append(None)
-                    deserializers.append(lambda x: x)
-                elif name in df.column_names:
-                    series_args.append(df[name])
-                    deserializers.append(_mk_deser(hints.get(name, Any)))
-                else:
-                    raise RuntimeError(
-                        f"Parameter '{name}' not found among inputs/columns for node {node.fn.__name__}"
-                    )
-
-            # Create mapping of series index to parameter
-            series_param_indices = []
-            for idx, name in enumerate(arg_names):
-                if series_args[idx] is not None:
-                    series_param_indices.append((name, deserializers[idx]))
+        # Index of the last mapped node reading each column, so columns can be
+        # dropped from the plan once no downstream node needs them
+        last_use: Dict[str, int] = {}
+        # (TypeKind, model class) each mapped consumer declares per column
+        consumer_kinds: Dict[str, set] = {}
+        for node_idx, node in enumerate(mapped_nodes):
+            for name in node.params:
+                last_use[name] = node_idx
+                consumer_kinds.setdefault(name, set()).add(
+                    node.kinds.get(name, _IDENTITY_KIND)
+                )
 
-            # Filter constants to only those needed by this node
-            node_constants = {
-                name: constants[name] for name in arg_names if name in constants
-            }
+        # Mapped outputs returned to the caller are never dropped
+        surfaced = self._surfaced_outputs(mapped_nodes)
+        for name in surfaced:
+            last_use[name] = len(mapped_nodes)
+
+        def _keeps_objects(name: str, kind: TypeKind, model_classes) -> bool:
+            """Whether a column can hold Python objects instead of Arrow structs.
+
+            True when the producer yields models and every consumer declares
+            the same kind with the producer's class (or a base of it), so no
+            dump/validate round-trip is needed. Other consumers get the
+            column dumped and validated into the class they declare.
+            """
+            if kind is TypeKind.IDENTITY or None in model_classes:
+                return False
+            return all(
+                consumer_kind is kind
+                and consumer_cls is not None
+                and all(issubclass(cls, consumer_cls) for cls in model_classes)
+                for consumer_kind, consumer_cls in consumer_kinds.get(name, ())
+            )
 
-            # Build a new DataFrame with the new column appended
-            call_series = [c for c in series_args if c is not None]
+        # Columns stored with Daft's python() dtype
+        object_cols = set()
+
+        # Build initial Daft DF with one column for the map_axis, passing the
+        # models through as-is when consumers take them as models
+        if all(isinstance(it, BaseModel) for it in items) and _keeps_objects(
+            map_axis, TypeKind.MODEL, {type(it) for it in items}
+        ):
+            object_cols.add(map_axis)
+            df = daft.from_pydict(
+                {
+                    map_axis: daft.Series.from_pylist(
+                        items, dtype=daft.DataType.python()
+                    )
+                }
+            )
+        else:
+            # Dictified Pydantic; a homogeneous batch is dumped in one call
+            item_type = type(items[0])
+            if all(type(it) is item_type for it in items):
+                dumped = _type_adapter(list[item_type]).dump_python(items)
+                df = _typed_column_df(map_axis, dumped, item_type)
+            else:
+                dumped = [it.model_dump() for it in items]
+                df = None
+            if df is None:
+                # Build the single column directly rather than transposing rows
+                df = daft.from_pydict({map_axis: dumped})
+
+        def _joins_group(group: List[int], node, node_idx: int) -> bool:
+            """Whether node can run in the same UDF as the group before it.
+
+            Every node must be row-wise, and the group's current last output
+            (which becomes an intermediate) may only be read inside the group.
+            Intermediates are handed over directly, exactly as they would
+            arrive through a column; any other inputs come from existing
+            columns or constants.
+            """
+            if node.meta.vectorized or mapped_nodes[group[0]].meta.vectorized:
+                return False
+            prev_out = mapped_nodes[group[-1]].meta.output_name
+            if last_use.get(prev_out, -1) > node_idx:
+                return False
+            for idx in group:
+                producer = mapped_nodes[idx]
+                name = producer.meta.output_name
+                if name not in node.params or name in constants:
+                    continue
+                kind, model_cls = producer.kinds.get("return", _IDENTITY_KIND)
+                if not _keeps_objects(name, kind, (model_cls,)) and not (
+                    kind is TypeKind.IDENTITY
+                    and node.kinds.get(name, _IDENTITY_KIND)[0] is TypeKind.IDENTITY
+                ):
+                    return False
+            return True
+
+        # Group consecutive mapped nodes that run as one UDF, so outputs
+        # consumed only inside a group never become Daft columns
+        groups: List[List[int]] = []
+        for node_idx, node in enumerate(mapped_nodes):
+            if groups and _joins_group(groups[-1], node, node_idx):
+                groups[-1].append(node_idx)
+            else:
+                groups.append([node_idx])
+
+        # We'll iteratively add columns to df for each group's final output
+        for group in groups:
+            last = mapped_nodes[group[-1]]
+            # Columns read by the group, in order of first use
+            group_cols: List[str] = []
+            # Output name -> position in the group of the node producing it
+            produced: Dict[str, int] = {}
+            # (node, series params, constants, sources) per group member
+            members = []
+
+            for member_pos, node_idx in enumerate(group):
+                node = mapped_nodes[node_idx]
+                series_param_indices = []
+                sources: List[Tuple[str, int]] = []
+                node_constants: Dict[str, Any] = {}
+
+                # Per-param type kinds (classified at registration) drive
+                # Pydantic reconstruction inside the UDF
+                for name in node.params:
+                    if name in constants and name != node.meta.map_axis:
+                        # Filter constants to only those needed by this node
+                        node_constants[name] = constants[name]
+                        continue
+                    if name in produced:
+                        # Output of an earlier node in this group
+                        producer = mapped_nodes[group[produced[name]]]
+                        kind = producer.kinds.get("return", _IDENTITY_KIND)[0]
+                        series_param_indices.append((name, TypeKind.IDENTITY, None))
+                        sources.append(
+                            (
+                                "dumped" if kind is TypeKind.IDENTITY else "out",
+                                produced[name],
+                            )
+                        )
+                        continue
+                    if name not in df.column_names:
+                        raise RuntimeError(
+                            f"Parameter '{name}' not found among inputs/columns for node {node.fn.__name__}"
+                        )
+                    kind, model_cls = (
+                        _IDENTITY_KIND
+                        if name in object_cols
+                        else node.kinds.get(name, _IDENTITY_KIND)
+                    )
+                    series_param_indices.append((name, kind, model_cls))
+                    if name not in group_cols:
+                        group_cols.append(name)
+                    sources.append(("col", group_cols.index(name)))
+
+                members.append((node, series_param_indices, node_constants, sources))
+                produced[node.meta.output_name] = member_pos
+
+            # Model outputs whose consumers all take models stay Python objects
+            return_kind, return_cls = last.kinds.get("return", _IDENTITY_KIND)
+            keep_objects = _keeps_objects(
+                last.meta.output_name, return_kind, (return_cls,)
+            )
+            if keep_objects:
+                object_cols.add(last.meta.output_name)
 
             # Create the batch UDF with proper closure capture
+            head, head_params, head_constants, _ = members[0]
             batch_udf = _make_batch_udf(
-                node, arg_names, series_param_indices, node_constants, items
+                head,
+                head_params,
+                head_constants,
+                items,
+                keep_objects=keep_objects,
+                udf_seconds=self._udf_seconds,
+                fused=members[1:],
             )
-            new_col_expr = batch_udf(*call_series)
-
-            # Keep existing columns + add the new one
-            keep_cols = [df[c].alias(c) for c in df.column_names]
-            df = df.select(*keep_cols, new_col_expr.alias(node.meta.output_name))
+            new_col_expr = batch_udf(*(df[name] for name in group_cols))
+
+            # Append the new column and drop inputs with no remaining consumers
+            df = df.with_column(last.meta.output_name, new_col_expr)
+            dead_cols = [
+                c
+                for c in df.column_names
+                if group[0] <= last_use.get(c, -1) <= group[-1]
+            ]
+            if dead_cols:
+                df = df.exclude(*dead_cols)
 
         # Finalize: collect wanted outputs
         merged: Dict[str, Any] = dict(constants)
 
         # If we have mapped nodes, collect their outputs from the dataframe
-        if mapped_nodes:
-            out_py = df.to_pylist()
-
-            # Get final output name from the last mapped node
-            final_name = mapped_nodes[-1].meta.output_name
-            # Reconstruct Pydantic models from dicts
-            hints = get_type_hints(mapped_nodes[-1].fn)
-            return_type = hints.get("return", Any)
-
-            # Check if return type is List[BaseModel]
-            origin = get_origin(return_type)
-            if origin is list:
-                args = get_args(return_type)
+        if surfaced:
+            # Execute the full plan (so every mapped node runs), but convert
+            # only the surfaced columns back to Python objects
+            columns = df.collect().select(*surfaced).to_pydict()
+            mapped_by_output = {n.meta.output_name: n for n in mapped_nodes}
+
+            for name in surfaced:
+                column = columns[name]
+                node = mapped_by_output[name]
+
+                # Validate the whole column in one pass through a cached TypeAdapter
+                return_kind, _ = node.kinds.get("return", _IDENTITY_KIND)
                 if (
-                    args
-                    and isinstance(args[0], type)
-                    and issubclass(args[0], BaseModel)
+                    name in object_cols
+                    or return_kind is TypeKind.IDENTITY
+                    or not self._validate_output
                 ):
-                    model_cls = args[0]
-                    merged[final_name] = [
-                        [model_cls.model_validate(d) for d in row[final_name]]
-                        for row in out_py
-                    ]
+                    merged[name] = column
                 else:
-                    merged[final_name] = [row[final_name] for row in out_py]
-            elif isinstance(return_type, type) and issubclass(return_type, BaseModel):
-                # Single BaseModel return type
-                merged[final_name] = [
-                    return_type.model_validate(row[final_name]) for row in out_py
-                ]
-            else:
-                merged[final_name] = [row[final_name] for row in out_py]
+                    # Reconstruct Pydantic models from dicts
+                    return_type = node.hints.get("return", Any)
+                    merged[name] = _type_adapter(list[return_type]).validate_python(
+                        column
+                    )
 
         return merged
 
 
-def _make_batch_udf(node, arg_names, series_param_indices, node_constants, items):
-    """Factory function to create batch UDF with proper variable capture."""
+@dataclass(slots=True)
+class _BatchUDFCtx:
+    """Everything a batch UDF needs, precomputed once per node.
 
-    # Get return type from the node function's type hints
-    hints = get_type_hints(node.fn)
-    return_type = hints.get("return", Any)
+    The UDF body closes over this single object instead of one cell per
+    variable, which keeps the payload Daft pickles for workers small (the
+    batch items themselves are reduced to their count).
+    """
 
-    # Convert to Daft DataType
-    try:
-        return_dtype = daft_datatype(return_type)
-    except Exception as e:
-        print(
-            f"Warning: Could not infer return dtype from {return_type}, falling back to python(): {e}"
-        )
+    fn: Callable
+    output_name: str
+    # (parameter, kind, model class) per series column, in call order
+    series_params: List[Tuple[str, TypeKind, Optional[type]]]
+    constants: Dict[str, Any]
+    # Specialized per-row call (None for vectorized nodes)
+    row_fn: Optional[Callable]
+    # Row count used when the node reads no series columns
+    n_rows_hint: int
+    keep_objects: bool = False
+    dump_adapter: Optional[TypeAdapter] = None
+    # Arrow type results are built as, so Daft receives a typed array
+    arrow_type: Optional["pyarrow.DataType"] = None
+    udf_seconds: Optional[List[float]] = None
+
+    def apply(self, cols: Tuple["daft.Series", ...]) -> Any:
+        """Run the node over one batch of columns."""
+        batch_start_ns = time.perf_counter_ns()
+        # Workers in distributed mode import this module without running
+        # _run_batch, so make sure the lazy imports are bound
+        _import_daft(globals())
+        row_fn = self.row_fn
+        if row_fn is None:
+            kwargs = {
+                name: _column_values(col, kind, model_cls)
+                for col, (name, kind, model_cls) in zip(cols, self.series_params)
+            }
+            res = self.fn(**kwargs, **self.constants)
+            out_list: List[Any] = res.tolist() if hasattr(res, "tolist") else list(res)
+            num_rows = len(cols[0]) if cols else self.n_rows_hint
+            if len(out_list) != num_rows:
+                raise ValueError(
+                    f"Vectorized node '{self.output_name}' returned "
+                    f"{len(out_list)} results for a batch of {num_rows} rows"
+                )
+        else:
+            # Convert each Series to a list once and walk the rows in lockstep
+            columns = [_column_list(c) for c in cols]
+            rows = zip(*columns) if columns else [()] * self.n_rows_hint
+            out_list = [row_fn(*values) for values in rows]
+
+        if self.keep_objects:
+            result = daft.Series.from_pylist(out_list, dtype=daft.DataType.python())
+        elif self.dump_adapter is not None:
+            # Declared model returns are dumped in a single adapter call
+            result = self.dump_adapter.dump_python(out_list)
+        else:
+            # Store as dicts (Pydantic -> dict; list[Pydantic] -> list[dict])
+            result = [_dump_result(res) for res in out_list]
+
+        if self.arrow_type is not None:
+            try:
+                result = pyarrow.array(result, type=self.arrow_type)
+            except (TypeError, pyarrow.ArrowException):
+                pass  # leave the conversion (and its errors) to Daft
+
+        if self.udf_seconds is not None:
+            self.udf_seconds.append((time.perf_counter_ns() - batch_start_ns) * 1e-9)
+        return result
+
+
+def _make_batch_udf(
+    node,
+    series_param_indices,
+    node_constants,
+    items,
+    keep_objects=False,
+    udf_seconds=None,
+    fused=(),
+):
+    """Factory function to create batch UDF with proper variable capture.
+
+    With keep_objects, results are returned as a python() Series of the
+    original objects instead of being dumped to Arrow-compatible dicts.
+    When udf_seconds is given, the time spent in each batch is appended to it.
+    fused lists (node, series params, constants, sources) for row-wise nodes
+    run after node in the same UDF; only the last node's output is returned
+    (see _fuse_row_fns for sources).
+    """
+    last = fused[-1][0] if fused else node
+
+    # Get return type from the final node function's type hints
+    return_type = last.hints.get("return", Any)
+    if keep_objects:
         return_dtype = daft.DataType.python()
+    else:
+        return_dtype = _return_dtype(return_type)
+
+    # Adapter for dumping a whole batch of declared model results at once
+    dump_adapter = None
+    return_kind, _ = last.kinds.get("return", _IDENTITY_KIND)
+    if return_kind is not TypeKind.IDENTITY and not keep_objects:
+        dump_adapter = _type_adapter(list[return_type])
+
+    # Converting the results with pyarrow directly is much faster than
+    # handing Daft a Python list to convert to return_dtype
+    arrow_type = None
+    if not keep_objects and return_dtype != daft.DataType.python():
+        arrow_type = return_dtype.to_arrow_dtype()
+
+    # Per-row call with argument binding unrolled for this node; vectorized
+    # nodes are called once per batch instead
+    row_fn = None
+    if not node.meta.vectorized:
+        row_fn = _specialize_row_fn(node.fn, series_param_indices, node_constants)
+    if fused:
+        row_fn = _fuse_row_fns(row_fn, len(series_param_indices), fused)
+
+    ctx = _BatchUDFCtx(
+        fn=node.fn,
+        output_name=last.meta.output_name,
+        series_params=series_param_indices,
+        constants=node_constants,
+        row_fn=row_fn,
+        n_rows_hint=len(items),
+        keep_objects=keep_objects,
+        dump_adapter=dump_adapter,
+        arrow_type=arrow_type,
+        udf_seconds=udf_seconds,
+    )
 
     @daft.func.batch(return_dtype=return_dtype)
     def _apply_batch(*cols):
-        # Convert Series to pylist per column
-        ser_lists: List[List[Any]] = []
-        for c in cols:
-            ser_lists.append(c.to_pylist())
-
-        out_list: List[Any] = []
-        rows = len(ser_lists[0]) if ser_lists else len(items)
-
-        for i in range(rows):
-            kwargs: Dict[str, Any] = {}
-            # Add constants
-            kwargs.update(node_constants)
-            # Add series-based arguments
-            for ser_idx, (param_name, deser) in enumerate(series_param_indices):
-                raw = ser_lists[ser_idx][i]
-                kwargs[param_name] = deser(raw)
-
-            # Call the original node function
-            res = node.fn(**kwargs)
-
-            # Store as dict (Pydantic -> dict; list[Pydantic] -> list[dict])
-            if isinstance(res, BaseModel):
-                out_list.append(res.model_dump())
-            elif isinstance(res, list) and res and isinstance(res[0], BaseModel):
-                out_list.append([r.model_dump() for r in res])
-            else:
-                out_list.append(res)
-
-        return out_list
+        return ctx.apply(cols)
 
     return _apply_batch
+
+
+def _column_list(col: "daft.Series") -> List[Any]:
+    """Convert a batch column to a list of Python values.
+
+    Null-free integer and float columns go through a zero-copy NumPy view of
+    the Arrow buffer, which unboxes faster than the generic to_pylist path.
+    """
+    if col.datatype().is_numeric():
+        arr = col.to_arrow()
+        if arr.null_count == 0 and (
+            pyarrow.types.is_integer(arr.type) or pyarrow.types.is_floating(arr.type)
+        ):
+            return arr.to_numpy(zero_copy_only=True).tolist()
+    return col.to_pylist()
+
+
+def _column_values(col: "daft.Series", kind: TypeKind, model_cls: Optional[type]):
+    """Convert a batch column into the argument passed to a vectorized node.
+
+    Numeric columns become NumPy arrays (nulls turn into NaN); other columns
+    become lists, with models reconstructed according to the parameter kind.
+    """
+    if col.datatype().is_numeric():
+        return col.to_arrow().to_numpy(zero_copy_only=False)
+    values = col.to_pylist()
+    if kind is TypeKind.IDENTITY:
+        return values
+    handler = _KIND_HANDLERS[kind]
+    return [handler(value, model_cls) for value in values]
+
+
+def _specialize_row_fn(fn, series_param_indices, node_constants):
+    """Generate a per-row function with argument binding unrolled.
+
+    For a node ``f(query, top_k)`` where query is a model column and top_k a
+    constant, this compiles the equivalent of::
+
+        def _row(r0, _fn=f, _m0=Query, _c0=top_k):
+            return _fn(query=_m0.model_validate(r0), top_k=_c0)
+
+    so each row costs one call instead of building a kwargs dict and
+    dispatching on deserializer kinds.
+    """
+    namespace: Dict[str, Any] = {"_fn": fn}
+    row_args = []
+    call_args = []
+
+    for idx, (name, kind, model_cls) in enumerate(series_param_indices):
+        row_args.append(f"r{idx}")
+        if kind is TypeKind.MODEL:
+            namespace[f"_m{idx}"] = model_cls
+            call_args.append(f"{name}=_m{idx}.model_validate(r{idx})")
+        elif kind is TypeKind.LIST_MODEL:
+            namespace[f"_m{idx}"] = model_cls
+            namespace[f"_h{idx}"] = _deser_list_model
+            call_args.append(f"{name}=_h{idx}(r{idx}, _m{idx})")
+        else:
+            call_args.append(f"{name}=r{idx}")
+
+    for idx, (name, value) in enumerate(node_constants.items()):
+        namespace[f"_c{idx}"] = value
+        call_args.append(f"{name}=_c{idx}")
+
+    # Bind everything as defaults so lookups are fast locals
+    params = row_args + [f"{key}={key}" for key in namespace]
+    source = (
+        f"def _row({', '.join(params)}):\n"
+        f"    return _fn({', '.join(call_args)})\n"
+    )
+    exec(source, dict(namespace), namespace)
+    return namespace["_row"]
+
+
+def _fuse_row_fns(row_fn, n_head_cols, fused):
+    """Compose a node's per-row call with the row-wise nodes fused after it.
+
+    The head node reads the first n_head_cols UDF columns in order. Each
+    fused node's sources give, per series parameter, ``("col", k)`` for the
+    k-th UDF column or ``("out", j)`` for the output of group member j (0 is
+    the head). ``("dumped", j)`` passes that output through _dump_result
+    first, as the unfused plan would have stored it in an Arrow column.
+    For a head ``f(query)`` and fused ``g(query, hits)`` this compiles::
+
+        def _row(c0, _s0=f_row, _s1=g_row, _dump=_dump_result):
+            v0 = _s0(c0)
+            return _s1(c0, v0)
+    """
+    columns = {k for *_, sources in fused for kind, k in sources if kind == "col"}
+    n_cols = max(columns | {n_head_cols - 1}) + 1
+    namespace: Dict[str, Any] = {"_s0": row_fn, "_dump": _dump_result}
+    lines = [f"    v0 = _s0({', '.join(f'c{k}' for k in range(n_head_cols))})"]
+
+    for pos, (node, series_param_indices, node_constants, sources) in enumerate(
+        fused, start=1
+    ):
+        # Intermediates arrive as-is, so only column inputs are deserialized
+        namespace[f"_s{pos}"] = _specialize_row_fn(
+            node.fn, series_param_indices, node_constants
+        )
+        args = []
+        for kind, k in sources:
+            if kind == "col":
+                args.append(f"c{k}")
+            elif kind == "dumped":
+                args.append(f"_dump(v{k})")
+            else:
+                args.append(f"v{k}")
+        lines.append(f"    v{pos} = _s{pos}({', '.join(args)})")
+    lines[-1] = lines[-1].replace(f"v{len(fused)} = ", "return ", 1)
+
+    # Bind everything as defaults so lookups are fast locals
+    params = [f"c{k}" for k in range(n_cols)] + [f"{key}={key}" for key in namespace]
+    source = f"def _row({', '.join(params)}):\n" + "\n".join(lines) + "\n"
+    exec(source, dict(namespace), namespace)
+    return namespace["_row"]
+
+
+def _dump_result(res: Any) -> Any:
+    """Convert an undeclared node result into Daft-friendly Python values."""
+    if isinstance(res, BaseModel):
+        return res.model_dump()
+    if isinstance(res, list) and res and isinstance(res[0], BaseModel):
+        return [r.model_dump() for r in res]
+    return res
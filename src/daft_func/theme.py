@@ -1,7 +1,9 @@
 """Theme detection for Jupyter and terminal environments."""
 
 import os
-from typing import Literal, Optional, TypedDict
+import sys
+from functools import lru_cache
+from typing import Any, Literal, Optional, Tuple, TypedDict
 
 
 class ThemeInfo(TypedDict):
@@ -11,6 +13,18 @@ class ThemeInfo(TypedDict):
     detected: bool
 
 
+def _get_ipython() -> Any:
+    """Return the active IPython shell, or None outside IPython.
+
+    Reads it from an already-imported IPython module instead of calling the
+    ``get_ipython`` builtin, so the common non-IPython case raises nothing.
+    """
+    ipython_module = sys.modules.get("IPython")
+    if ipython_module is None:
+        return None
+    return ipython_module.get_ipython()
+
+
 def detect_jupyter_theme() -> Optional[Literal["dark", "light"]]:
     """Detect Jupyter notebook theme (dark/light).
 
@@ -19,7 +33,9 @@ def detect_jupyter_theme() -> Optional[Literal["dark", "light"]]:
     """
     try:
         # Check if we're in a Jupyter environment
-        ipython = get_ipython()  # type: ignore
+        ipython = _get_ipython()
+        if ipython is None:
+            return None
 
         # Check if running in VSCode (IPython has vscode attribute)
         if hasattr(ipython, "config"):
@@ -50,7 +66,7 @@ def detect_jupyter_theme() -> Optional[Literal["dark", "light"]]:
         # so return None to use default
         return None
 
-    except (NameError, ImportError):
+    except ImportError:
         # Not in Jupyter
         return None
 
@@ -113,24 +129,28 @@ def detect_theme(explicit_theme: Optional[str] = None) -> ThemeInfo:
     if explicit_theme in ("dark", "light"):
         return ThemeInfo(mode=explicit_theme, detected=True)
 
+    mode, detected = _detect_environment_theme()
+    return ThemeInfo(mode=mode, detected=detected)
+
+
+@lru_cache(maxsize=1)
+def _detect_environment_theme() -> Tuple[Literal["dark", "light"], bool]:
+    """Detect the theme from the environment once per process."""
     # Try Jupyter detection first
     jupyter_theme = detect_jupyter_theme()
     if jupyter_theme:
-        return ThemeInfo(mode=jupyter_theme, detected=True)
+        return jupyter_theme, True
 
     # Try terminal detection
     terminal_theme = detect_terminal_theme()
     if terminal_theme:
-        return ThemeInfo(mode=terminal_theme, detected=True)
+        return terminal_theme, True
 
     # Default to dark (most common for developers)
-    return ThemeInfo(mode="dark", detected=False)
+    return "dark", False
 
 
+@lru_cache(maxsize=1)
 def is_jupyter() -> bool:
     """Check if running in Jupyter environment."""
-    try:
-        get_ipython()  # type: ignore
-        return True
-    except NameError:
-        return False
+    return _get_ipython() is not None
@@ -1,16 +1,58 @@
 """Type conversion utilities for Pydantic models to Daft/PyArrow types."""
 
-from typing import Any, Union, get_args, get_origin
+import importlib.util
+from enum import IntEnum
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import BaseModel
 
-try:
+# Probe without importing: daft and pyarrow take a noticeable share of import
+# time, so they are only imported once a conversion or batch run needs them
+DAFT_AVAILABLE = (
+    importlib.util.find_spec("daft") is not None
+    and importlib.util.find_spec("pyarrow") is not None
+)
+
+if TYPE_CHECKING:
+    import daft
+    import pyarrow
+
+
+def _import_daft(namespace: Optional[Dict[str, Any]] = None) -> None:
+    """Import daft and pyarrow into a module's globals on first use.
+
+    Args:
+        namespace: Globals to bind them in (default: this module's), so other
+            modules that import them lazily can share this helper
+    """
     import daft
     import pyarrow
 
-    DAFT_AVAILABLE = True
-except ImportError:
-    DAFT_AVAILABLE = False
+    target = globals() if namespace is None else namespace
+    target["daft"] = daft
+    target["pyarrow"] = pyarrow
+
+
+@lru_cache(maxsize=None)
+def _primitive_arrow_types() -> Dict[type, "pyarrow.DataType"]:
+    """Exact builtin scalar types; subclasses go through the issubclass chain."""
+    return {
+        bool: pyarrow.bool_(),
+        str: pyarrow.string(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+        bytes: pyarrow.binary(),
+    }
 
 
 def pyarrow_datatype(f_type: type[Any]) -> "pyarrow.DataType":
@@ -18,9 +60,23 @@ def pyarrow_datatype(f_type: type[Any]) -> "pyarrow.DataType":
 
     Based on the pattern from Daft's PDF processing example.
     Supports: Pydantic models, lists, dicts, unions/optionals, and primitives.
+    Results are cached per type, so each model's field tree is walked once.
     """
     if not DAFT_AVAILABLE:
         raise ImportError("pyarrow is required for type conversion")
+    _import_daft()
+    try:
+        return _pyarrow_datatype_cached(f_type)
+    except TypeError:
+        # Unhashable annotation; convert without caching (re-raises if unsupported)
+        return _pyarrow_datatype_cached.__wrapped__(f_type)
+
+
+@lru_cache(maxsize=None)
+def _pyarrow_datatype_cached(f_type: type[Any]) -> "pyarrow.DataType":
+    primitive = _primitive_arrow_types().get(f_type)
+    if primitive is not None:
+        return primitive
 
     if get_origin(f_type) is Union:
         targs = get_args(f_type)
@@ -95,4 +151,60 @@ def daft_datatype(f_type: type[Any]) -> "daft.DataType":
     """Convert Python/Pydantic types to Daft DataTypes via PyArrow."""
     if not DAFT_AVAILABLE:
         raise ImportError("daft is required for type conversion")
+    _import_daft()
+    try:
+        return _daft_datatype_cached(f_type)
+    except TypeError:
+        return daft.DataType.from_arrow_type(pyarrow_datatype(f_type))
+
+
+@lru_cache(maxsize=None)
+def _daft_datatype_cached(f_type: type[Any]) -> "daft.DataType":
     return daft.DataType.from_arrow_type(pyarrow_datatype(f_type))
+
+
+class TypeKind(IntEnum):
+    """How values of an annotated type are rebuilt from Daft column values."""
+
+    IDENTITY = 0
+    MODEL = 1
+    LIST_MODEL = 2
+
+
+def _is_model_class(tp: Any) -> bool:
+    """Check whether tp is a Pydantic model class."""
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _classify_type_cached(py_type: Any) -> Tuple[TypeKind, Optional[type]]:
+    if _is_model_class(py_type):
+        return TypeKind.MODEL, py_type
+    if get_origin(py_type) is list:
+        args = get_args(py_type)
+        if args and _is_model_class(args[0]):
+            return TypeKind.LIST_MODEL, args[0]
+    return TypeKind.IDENTITY, None
+
+
+def classify_type(py_type: Any) -> Tuple[TypeKind, Optional[type]]:
+    """Classify a type annotation for column (de)serialization.
+
+    Args:
+        py_type: Type annotation to classify
+
+    Returns:
+        Tuple of (TypeKind, model class or None)
+    """
+    try:
+        return _classify_type_cached(py_type)
+    except TypeError:
+        # Unhashable annotation (e.g. Annotated with unhashable metadata)
+        return _classify_type_cached.__wrapped__(py_type)
+
+
+def clear_type_caches() -> None:
+    """Forget all cached type conversions (e.g. after redefining models)."""
+    _pyarrow_datatype_cached.cache_clear()
+    _daft_datatype_cached.cache_clear()
+    _classify_type_cached.cache_clear()
@@ -1,10 +1,10 @@
 """Visualization utilities for DAG pipelines using Graphviz."""
 
-import html
 import inspect
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, Literal, Optional, get_type_hints
+from functools import lru_cache
+from typing import Any, Dict, Literal, Optional
 
 import networkx as nx
 
@@ -13,6 +13,16 @@ from daft_func.pipeline import NodeDef, Pipeline
 _empty = inspect.Parameter.empty
 MAX_LABEL_LENGTH = 30
 
+# Same replacements as _esc(quote=True), applied in a single pass
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _esc(s: str) -> str:
+    """Escape a label fragment for Graphviz HTML-like labels."""
+    return s.translate(_HTML_ESCAPE_TABLE)
+
 
 @dataclass(frozen=True)
 class GroupedArgs:
@@ -79,6 +89,20 @@ def _type_as_string(type_hint: Any) -> str:
     return type_str
 
 
+@lru_cache(maxsize=1024)
+def _type_label_cached(type_hint: Any) -> str:
+    return _esc(_trim(_type_as_string(type_hint)))
+
+
+def _type_label(type_hint: Any) -> str:
+    """Escaped, trimmed display string for a type hint, cached per hint."""
+    try:
+        return _type_label_cached(type_hint)
+    except TypeError:
+        # Unhashable annotation (e.g. Annotated with unhashable metadata)
+        return _type_label_cached.__wrapped__(type_hint)
+
+
 def build_graph(pipeline: Pipeline) -> nx.DiGraph:
     """Build a NetworkX directed graph from a pipeline.
 
@@ -90,25 +114,18 @@ def build_graph(pipeline: Pipeline) -> nx.DiGraph:
     """
     graph = nx.DiGraph()
 
-    # Use all registered nodes
-    ordered_nodes = pipeline.nodes
-
-    # Track which outputs are available (from node outputs)
-    available_outputs = {node.meta.output_name for node in pipeline.nodes}
+    # Producer of each output name, for O(1) source lookups
+    by_output = pipeline.by_output
 
     # Add nodes and edges
-    for node in ordered_nodes:
+    for node in pipeline.nodes:
         # Add function node with metadata
         graph.add_node(node, node_type="function")
 
         # Add edges from parameters to function
         for param in node.params:
             # Check if this param is an output from another node
-            source_node = None
-            for other_node in pipeline.nodes:
-                if other_node.meta.output_name == param:
-                    source_node = other_node
-                    break
+            source_node = by_output.get(param)
 
             if source_node:
                 # Edge from function to function
@@ -164,17 +181,22 @@ def create_grouped_parameter_graph(
 ) -> nx.DiGraph:
     """Create a new graph with grouped exclusive input parameters for each function.
 
+    The input graph is never modified. When nothing gets grouped it is
+    returned as-is rather than copied, so treat the result as read-only.
+
     Args:
         graph: The original graph with individual parameter nodes
         min_arg_group_size: Minimum number of parameters to group. If None, no grouping.
 
     Returns:
-        New graph with grouped parameter nodes where applicable
+        Graph with grouped parameter nodes where applicable
     """
-    new_graph = graph.copy()
-
-    if min_arg_group_size is None:
-        return new_graph
+    # Without input parameter nodes (e.g. fully chained pipelines) or with
+    # grouping disabled there is nothing to group
+    if min_arg_group_size is None or not any(
+        isinstance(node, str) for node in graph.nodes
+    ):
+        return graph
 
     # Ensure minimum of 2 for grouping to make sense
     min_arg_group_size = max(min_arg_group_size, 2)
@@ -182,27 +204,35 @@ def create_grouped_parameter_graph(
     groups_to_create = _find_exclusive_parameters(graph, min_arg_group_size)
 
     if not groups_to_create:
-        return new_graph  # Return copy if no grouping needed
+        return graph
 
     # Track which parameters are in any group
     params_in_any_group: set[str] = set()
     for params in groups_to_create.values():
         params_in_any_group.update(params)
 
-    # Create grouped nodes
-    for target_func, params_list in groups_to_create.items():
-        grouped_node = GroupedArgs(args=tuple(sorted(params_list)))
-
-        # Add grouped node
-        new_graph.add_node(grouped_node, node_type="grouped_args")
-        new_graph.add_edge(grouped_node, target_func, param_name="grouped")
+    # Build the reduced graph directly, leaving grouped parameters out
+    new_graph = nx.DiGraph(**graph.graph)
+    new_graph.add_nodes_from(
+        (node, data)
+        for node, data in graph.nodes(data=True)
+        if node not in params_in_any_group
+    )
+    new_graph.add_edges_from(
+        (source, target, data)
+        for source, target, data in graph.edges(data=True)
+        if source not in params_in_any_group
+    )
 
-        # Remove individual parameter nodes and their edges
-        for param_name in params_list:
-            if new_graph.has_edge(param_name, target_func):
-                new_graph.remove_edge(param_name, target_func)
-            if new_graph.has_node(param_name):
-                new_graph.remove_node(param_name)
+    # Add one grouped node per function, with a single edge to it
+    new_graph.add_nodes_from(
+        (GroupedArgs(args=tuple(params_list)), {"node_type": "grouped_args"})
+        for params_list in groups_to_create.values()
+    )
+    new_graph.add_edges_from(
+        (GroupedArgs(args=tuple(params_list)), target_func, {"param_name": "grouped"})
+        for target_func, params_list in groups_to_create.items()
+    )
 
     return new_graph
 
@@ -227,25 +257,25 @@ def _generate_node_label(
     if node_type == "grouped_args":
         # Grouped parameters node
         grouped: GroupedArgs = node
-        label = '<TABLE BORDER="0">'
+        rows = ['<TABLE BORDER="0">']
         for param_name in grouped.args:
             type_hint = hints.get(param_name)
             default_value = defaults.get(param_name, _empty)
 
-            parts = [f"<b>{html.escape(param_name)}</b>"]
+            parts = [f"<b>{_esc(param_name)}</b>"]
 
             if type_hint:
-                type_str = _trim(_type_as_string(type_hint))
-                parts.append(f" : <i>{html.escape(type_str)}</i>")
+                type_str = _type_label(type_hint)
+                parts.append(f" : <i>{type_str}</i>")
 
             if default_value is not _empty:
                 default_str = _trim(str(default_value))
-                parts.append(f" = {html.escape(default_str)}")
+                parts.append(f" = {_esc(default_str)}")
 
-            label += f"<TR><TD>{' '.join(parts)}</TD></TR>"
+            rows.append(f"<TR><TD>{' '.join(parts)}</TD></TR>")
 
-        label += "</TABLE>"
-        return label
+        rows.append("</TABLE>")
+        return "".join(rows)
 
     elif node_type == "input":
         # Input parameter node
@@ -253,15 +283,15 @@ def _generate_node_label(
         type_hint = hints.get(param_name)
         default_value = defaults.get(param_name, _empty)
 
-        parts = [f"<b>{html.escape(param_name)}</b>"]
+        parts = [f"<b>{_esc(param_name)}</b>"]
 
         if type_hint:
-            type_str = _trim(_type_as_string(type_hint))
-            parts.append(f" : <i>{html.escape(type_str)}</i>")
+            type_str = _type_label(type_hint)
+            parts.append(f" : <i>{type_str}</i>")
 
         if default_value is not _empty:
             default_str = _trim(str(default_value))
-            parts.append(f" = {html.escape(default_str)}")
+            parts.append(f" = {_esc(default_str)}")
 
         return " ".join(parts)
 
@@ -270,30 +300,25 @@ def _generate_node_label(
         node_def: NodeDef = node
         fn_name = node_def.fn.__name__
 
-        # Get type hints for the function
-        try:
-            fn_hints = get_type_hints(node_def.fn)
-        except Exception:
-            fn_hints = {}
+        # Type hints are resolved once at registration
+        fn_hints = node_def.hints
 
         # Build HTML table for function node
-        label = (
-            f'<TABLE BORDER="0"><TR><TD><B>{html.escape(fn_name)}</B></TD></TR><HR/>'
-        )
+        rows = [f'<TABLE BORDER="0"><TR><TD><B>{_esc(fn_name)}</B></TD></TR><HR/>']
 
         # Add output with type annotation
         output_name = node_def.meta.output_name
         return_type = fn_hints.get("return")
 
-        parts = [f"<b>{html.escape(output_name)}</b>"]
+        parts = [f"<b>{_esc(output_name)}</b>"]
         if return_type:
-            type_str = _trim(_type_as_string(return_type))
-            parts.append(f" : <i>{html.escape(type_str)}</i>")
+            type_str = _type_label(return_type)
+            parts.append(f" : <i>{type_str}</i>")
 
-        label += f"<TR><TD>{' '.join(parts)}</TD></TR>"
-        label += "</TABLE>"
+        rows.append(f"<TR><TD>{' '.join(parts)}</TD></TR>")
+        rows.append("</TABLE>")
 
-        return label
+        return "".join(rows)
 
 
 def visualize_graphviz(
@@ -361,82 +386,85 @@ def visualize_graphviz(
         },
     )
 
+    # Materialize the node view once; the node and edge loops below reuse
+    # each node's type and Graphviz id instead of recomputing them
+    node_types = {
+        node: data.get("node_type", "input")
+        for node, data in plot_graph.nodes(data=True)
+    }
+    node_ids = {node: str(id(node)) for node in node_types}
+
     # Collect type hints and defaults from all function nodes
     hints: Dict[str, Any] = {}
     defaults: Dict[str, Any] = {}
 
-    for node, data in plot_graph.nodes(data=True):
-        if data.get("node_type") == "function":
+    for node, node_type in node_types.items():
+        if node_type == "function":
             node_def: NodeDef = node
-            try:
-                fn_hints = get_type_hints(node_def.fn)
-                hints.update(fn_hints)
-            except Exception:
-                pass
-
-            # Get parameter defaults
-            sig = inspect.signature(node_def.fn)
-            for param_name, param in sig.parameters.items():
-                if param.default is not _empty:
-                    defaults[param_name] = param.default
-
-    # Add nodes to the graph
-    input_nodes = []
-    function_nodes = []
-    grouped_args_nodes = []
-
-    for node, data in plot_graph.nodes(data=True):
-        node_type = data.get("node_type", "input")
+            # Hints and defaults are both read once at registration
+            hints.update(node_def.hints)
+            defaults.update(node_def.defaults)
+
+    # Add nodes to the graph, noting which kinds appear (for the legend)
+    node_types_present = set()
+
+    for node, node_type in node_types.items():
         label = _generate_node_label(node, node_type, hints, defaults)
+        node_types_present.add(node_type)
 
         if node_type == "input":
-            input_nodes.append(node)
             digraph.node(
-                str(id(node)),  # Use id for unique node identifier
+                node_ids[node],  # Use id for unique node identifier
                 label=f"<{label}>",
                 fillcolor=style.arg_node_color,
                 shape="rectangle",
                 style="filled,dashed",
             )
         elif node_type == "grouped_args":
-            grouped_args_nodes.append(node)
             digraph.node(
-                str(id(node)),
+                node_ids[node],
                 label=f"<{label}>",
                 fillcolor=style.grouped_args_node_color,
                 shape="rectangle",
                 style="filled,solid",
             )
         else:
-            function_nodes.append(node)
             digraph.node(
-                str(id(node)),
+                node_ids[node],
                 label=f"<{label}>",
                 fillcolor=style.func_node_color,
                 shape="box",
                 style="filled,rounded",
             )
 
+    # Edge color depends only on the source node's type
+    arg_edge_color = style.arg_edge_color or style.arg_node_color
+    grouped_edge_color = (
+        style.grouped_args_edge_color or style.grouped_args_node_color
+    )
+    output_edge_color = style.output_edge_color or style.func_node_color
+    edge_font_size = str(style.edge_font_size)
+
     # Add edges
     for source, target, data in plot_graph.edges(data=True):
         param_name = data.get("param_name", "")
 
         # Determine edge color
-        source_type = plot_graph.nodes[source].get("node_type", "input")
+        source_type = node_types[source]
         if source_type == "input":
-            edge_color = style.arg_edge_color or style.arg_node_color
+            edge_color = arg_edge_color
         elif source_type == "grouped_args":
-            edge_color = style.grouped_args_edge_color or style.grouped_args_node_color
+            edge_color = grouped_edge_color
         else:
-            edge_color = style.output_edge_color or style.func_node_color
+            edge_color = output_edge_color
 
         digraph.edge(
-            str(id(source)),
-            str(id(target)),
+            node_ids[source],
+            node_ids[target],
             label=param_name if param_name != "grouped" else "",
             color=edge_color,
             fontname=style.font_name,
-            fontsize=str(style.edge_font_size),
+            fontsize=edge_font_size,
             fontcolor="transparent",  # Hide edge labels
         )
 
@@ -458,7 +486,7 @@ def visualize_graphviz(
 
         legend_items = []
 
-        if input_nodes:
+        if "input" in node_types_present:
             legend_subgraph.node(
                 "legend_input",
                 label="Input",
@@ -468,7 +496,7 @@ def visualize_graphviz(
             )
             legend_items.append("legend_input")
 
-        if grouped_args_nodes:
+        if "grouped_args" in node_types_present:
             legend_subgraph.node(
                 "legend_grouped",
                 label="Grouped Inputs",
@@ -478,7 +506,7 @@ def visualize_graphviz(
             )
             legend_items.append("legend_grouped")
 
-        if function_nodes:
+        if "function" in node_types_present:
             legend_subgraph.node(
                 "legend_function",
                 label="Function",
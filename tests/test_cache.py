@@ -323,10 +323,58 @@ def test_cache_backend_diskcache(temp_cache_dir):
 
     # Verify cache files exist
     cache_path = Path(temp_cache_dir)
-    assert (cache_path / "metadata.json").exists()
+    assert (cache_path / "metadata.sqlite").exists()
     assert (cache_path / "blobs").exists()
 
 
+def test_diskcache_metadata_persists_and_imports_json(temp_cache_dir):
+    """Test that signatures persist across instances and legacy JSON is imported."""
+    import json
+
+    from daft_func.cache import NodeSignature
+
+    legacy = {
+        "old": {
+            "node_name": "old",
+            "code_hash": "c",
+            "env_hash": "",
+            "inputs_hash": "i",
+            "deps_hash": "d",
+            "timestamp": 1.0,
+        }
+    }
+    (Path(temp_cache_dir) / "metadata.json").write_text(json.dumps(legacy))
+
+    backend = DiskCache(cache_dir=temp_cache_dir)
+    assert backend.get_meta("old") == NodeSignature(**legacy["old"])
+    assert not (Path(temp_cache_dir) / "metadata.json").exists()
+
+    backend.set_meta(NodeSignature("new", "c2", "", "i2", "d2", 2.0))
+    reopened = DiskCache(cache_dir=temp_cache_dir)
+    assert set(reopened.get_meta_many(["old", "new", "missing"])) == {"old", "new"}
+
+    reopened.clear()
+    assert reopened.get_meta("new") is None
+    backend.close()
+    reopened.close()
+
+
+def test_diskcache_keeps_unreadable_json_and_closes(temp_cache_dir):
+    """Test that an unparsable metadata.json is kept and close() releases stores."""
+    import sqlite3
+
+    meta_file = Path(temp_cache_dir) / "metadata.json"
+    meta_file.write_text("{not json")
+
+    with DiskCache(cache_dir=temp_cache_dir) as backend:
+        assert backend.get_meta("old") is None
+    assert meta_file.read_text() == "{not json"
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        backend.get_meta("old")
+    backend.close()  # closing twice is harmless
+
+
 def test_dependency_depth(temp_cache_dir):
     """Test that dependency_depth parameter is used."""
 
@@ -410,3 +458,103 @@ def test_cache_clears_signatures_between_runs(temp_cache_dir):
 
     # Verify signatures are consistent
     assert len(runner._current_signatures) == len(sigs_after_run1)
+
+
+def test_local_loop_prefetches_signatures(temp_cache_dir):
+    """Test that the local loop fetches stored signatures in one batch call."""
+    executions = []
+
+    @func(output="result", map_axis="item", key_attr="name", cache=True)
+    def process(item: InputModel) -> int:
+        executions.append(item.name)
+        return item.value * 2
+
+    backend = DiskCache(cache_dir=temp_cache_dir)
+    single_lookups = []
+    original_get_meta = backend.get_meta
+    backend.get_meta = lambda key: single_lookups.append(key) or original_get_meta(key)
+
+    pipeline = Pipeline(functions=[process])
+    cache_config = CacheConfig(enabled=True, backend=backend, verbose=False)
+    runner = Runner(pipeline=pipeline, mode="local", cache_config=cache_config)
+    items = [InputModel(value=i, name=f"n{i}") for i in range(3)]
+
+    assert runner.run(inputs={"item": items})["result"] == [0, 2, 4]
+    assert runner.run(inputs={"item": items})["result"] == [0, 2, 4]
+    assert executions == ["n0", "n1", "n2"]
+    assert single_lookups == []
+
+
+def test_repeat_hits_skip_blob_loads(temp_cache_dir):
+    """Test that memory_items serves outputs a runner has seen from memory."""
+
+    @func(output="result", cache=True)
+    def double(x: int) -> int:
+        return x * 2
+
+    backend = DiskCache(cache_dir=temp_cache_dir)
+    blob_loads = []
+    original_get_blob = backend.get_blob
+    backend.get_blob = lambda key: blob_loads.append(key) or original_get_blob(key)
+
+    pipeline = Pipeline(functions=[double])
+    cache_config = CacheConfig(
+        enabled=True, backend=backend, verbose=False, memory_items=8
+    )
+    runner = Runner(pipeline=pipeline, mode="local", cache_config=cache_config)
+
+    assert runner.run(inputs={"x": 1})["result"] == 2
+    assert runner.run(inputs={"x": 1})["result"] == 2
+    assert blob_loads == []
+
+    # A fresh runner loads from disk once, then keeps the output in memory
+    other = Runner(pipeline=pipeline, mode="local", cache_config=cache_config)
+    assert other.run(inputs={"x": 1})["result"] == 2
+    assert other.run(inputs={"x": 1})["result"] == 2
+    assert blob_loads == ["result"]
+
+    # Changed inputs are a different signature, not a stale memory hit
+    assert other.run(inputs={"x": 3})["result"] == 6
+
+
+def test_cache_hits_are_fresh_copies_by_default(temp_cache_dir):
+    """Test that a node mutating a cached input does not change later hits."""
+
+    @func(output="values", cache=True)
+    def make(n: int) -> list:
+        return list(range(n))
+
+    @func(output="total")
+    def total(values: list) -> int:
+        values.append(100)
+        return sum(values)
+
+    pipeline = Pipeline(functions=[make, total])
+    cache_config = CacheConfig(
+        enabled=True, backend=DiskCache(cache_dir=temp_cache_dir), verbose=False
+    )
+    runner = Runner(pipeline=pipeline, mode="local", cache_config=cache_config)
+
+    totals = [runner.run(inputs={"n": 3})["total"] for _ in range(3)]
+    assert totals == [103, 103, 103]
+
+
+def test_item_cache_key_uses_prebuilt_getter():
+    """Test that item keys read key_attr through the node's attrgetter."""
+    from daft_func.cache import get_item_cache_key
+
+    @func(output="result", map_axis="item", key_attr="name", cache=True)
+    def process(item: InputModel) -> int:
+        return item.value
+
+    @func(output="other", map_axis="item", key_attr="uuid", cache=True)
+    def other(item: InputModel) -> int:
+        return item.value
+
+    node, other_node = Pipeline(functions=[process, other]).nodes
+    item = InputModel(value=1, name="first")
+
+    assert get_item_cache_key(item, key_getter=node.key_getter) == "first"
+    assert get_item_cache_key(item, "name") == "first"
+    # A missing attribute falls back to the common ID fields
+    assert get_item_cache_key(item, key_getter=other_node.key_getter) == "first"
@@ -1,7 +1,6 @@
 """Demo to test progress bar alignment with cached vs non-cached nodes."""
 
 import tempfile
-import time
 
 from daft_func import CacheConfig, DiskCache, Pipeline, Runner, func
 
@@ -10,28 +9,24 @@ from daft_func import CacheConfig, DiskCache, Pipeline, Runner, func
 @func(output="step1", cache=True)
 def step1(x: int) -> int:
     """Cached step."""
-    time.sleep(0.5)
     return x * 2
 
 
 @func(output="step2", cache=True)
 def step2(step1: int) -> int:
     """Cached step."""
-    time.sleep(0.5)
     return step1 + 10
 
 
 @func(output="step3")
 def step3(step2: int) -> int:
     """Non-cached step."""
-    time.sleep(0.3)
     return step2 * 3
 
 
 @func(output="final_result")
 def final_result(step3: int) -> int:
     """Non-cached step."""
-    time.sleep(0.3)
     return step3 + 5
 
 
@@ -55,8 +50,6 @@ with tempfile.TemporaryDirectory() as tmpdir:
     print(f"Result: {result1['final_result']}")
     print()
 
-    time.sleep(1)
-
     # Second run - cached nodes show ⚡
     print("--- Second Run (step1 and step2 cached with ⚡) ---")
     result2 = runner.run(inputs={"x": 10})
@@ -183,3 +183,30 @@ def test_cache_logging_format(temp_cache_dir, capsys):
     assert "a:" in captured.out
     assert "b:" in captured.out
     assert "c:" in captured.out
+
+
+def test_cache_event_callback(temp_cache_dir, capsys):
+    """Test that on_event receives cache events without printing."""
+    events = []
+
+    @func(output="result", cache=True)
+    def compute(x: int) -> int:
+        return x * 2
+
+    pipeline = Pipeline(functions=[compute])
+    cache_config = CacheConfig(
+        enabled=True,
+        backend=DiskCache(cache_dir=temp_cache_dir),
+        verbose=False,
+        on_event=events.append,
+    )
+    runner = Runner(pipeline=pipeline, mode="local", cache_config=cache_config)
+
+    runner.run(inputs={"x": 5})
+    runner.run(inputs={"x": 5})
+
+    assert [(e.node_name, e.cache_hit) for e in events] == [
+        ("result", False),
+        ("result", True),
+    ]
+    assert "[CACHE]" not in capsys.readouterr().out
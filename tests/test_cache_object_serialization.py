@@ -2,6 +2,9 @@
 
 import pytest
 
+from pydantic import BaseModel, ConfigDict
+
+from daft_func import cache
 from daft_func.cache import compute_inputs_hash
 
 
@@ -202,5 +205,128 @@ def test_dict_values_serialization():
     assert hash1 == hash2, "Dict values should be serialized consistently"
 
 
+def test_frozen_model_dump_reused():
+    """Test that frozen models are dumped once and released with the instance."""
+
+    class FrozenConfig(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        top_k: int
+
+    config = FrozenConfig(top_k=3)
+    hash1 = compute_inputs_hash({"config": config})
+    assert id(config) in cache._FROZEN_DUMPS
+    assert compute_inputs_hash({"config": config}) == hash1
+    assert hash1 == compute_inputs_hash({"config": FrozenConfig(top_k=3)})
+
+    key = id(config)
+    del config
+    assert key not in cache._FROZEN_DUMPS
+
+
+def test_frozen_model_with_mutable_fields_is_rehashed():
+    """Test that frozen models holding mutable values are dumped every time."""
+    from typing import List
+
+    class Inner(BaseModel):
+        value: int
+
+    class FrozenWeights(BaseModel):
+        model_config = ConfigDict(frozen=True)
+        weights: List[int]
+        inner: Inner
+
+    config = FrozenWeights(weights=[1, 2], inner=Inner(value=1))
+    hash1 = compute_inputs_hash({"config": config})
+    assert id(config) not in cache._FROZEN_DUMPS
+
+    config.weights.append(3)
+    hash2 = compute_inputs_hash({"config": config})
+    assert hash2 != hash1
+
+    config.inner.value = 2
+    assert compute_inputs_hash({"config": config}) != hash2
+
+
+def test_model_hashing_uses_json_only_when_stable():
+    """Test that models hash by JSON unless field order could vary."""
+    from typing import Dict, List, Optional
+
+    class Hit(BaseModel):
+        model_config = ConfigDict(ser_json_inf_nan="constants")
+        doc_id: str
+        score: float
+
+    class Result(BaseModel):
+        hits: List[Hit]
+        note: Optional[str] = None
+
+    class Tagged(BaseModel):
+        tags: Dict[str, int]
+
+    result = Result(hits=[Hit(doc_id="d1", score=1.0)])
+    assert "__json__" in cache._dump_model(result)
+    assert compute_inputs_hash({"r": result}) == compute_inputs_hash(
+        {"r": Result(hits=[Hit(doc_id="d1", score=1.0)])}
+    )
+    assert compute_inputs_hash({"r": result}) != compute_inputs_hash(
+        {"r": Result(hits=[Hit(doc_id="d1", score=2.0)])}
+    )
+
+    # Dict fields keep the canonical (key-sorted) encoding
+    assert "__json__" not in cache._dump_model(Tagged(tags={"a": 1}))
+    assert compute_inputs_hash({"t": Tagged(tags={"a": 1, "b": 2})}) == (
+        compute_inputs_hash({"t": Tagged(tags={"b": 2, "a": 1})})
+    )
+
+
+def test_model_hashing_keeps_inf_nan_and_none_distinct():
+    """Test that inf, -inf, NaN and None fields hash differently."""
+    from typing import Optional
+
+    class Score(BaseModel):
+        value: Optional[float] = None
+
+    class ConstScore(BaseModel):
+        model_config = ConfigDict(ser_json_inf_nan="constants")
+        value: Optional[float] = None
+
+    # Default config writes inf/NaN as null, so floats skip the JSON path
+    assert "__json__" not in cache._dump_model(Score())
+    assert "__json__" in cache._dump_model(ConstScore())
+
+    values = [float("inf"), float("-inf"), float("nan"), None]
+    for model in (Score, ConstScore):
+        hashes = {compute_inputs_hash({"s": model(value=v)}) for v in values}
+        assert len(hashes) == len(values)
+
+
+def test_model_hashing_checks_extra_fields_and_string_floats():
+    """Test that extra fields and string-encoded floats skip the JSON path."""
+    from typing import Union
+
+    class Loose(BaseModel):
+        model_config = ConfigDict(extra="allow")
+        name: str
+
+    # Undeclared extras keep the canonical encoding
+    assert "__json__" not in cache._dump_model(Loose(name="a"))
+    extras = [float("inf"), float("nan"), None]
+    hashes = {compute_inputs_hash({"m": Loose(name="a", x=v)}) for v in extras}
+    assert len(hashes) == len(extras)
+    assert compute_inputs_hash({"m": Loose(name="a", d={"a": 1, "b": 2})}) == (
+        compute_inputs_hash({"m": Loose(name="a", d={"b": 2, "a": 1})})
+    )
+
+    class StringScore(BaseModel):
+        model_config = ConfigDict(ser_json_inf_nan="strings")
+        value: Union[float, str]
+
+    # "strings" writes inf as "Infinity", the same as the string itself
+    assert "__json__" not in cache._dump_model(StringScore(value=1.0))
+    assert compute_inputs_hash({"s": StringScore(value=float("inf"))}) != (
+        compute_inputs_hash({"s": StringScore(value="Infinity")})
+    )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -105,6 +105,7 @@ def test_progress_config_defaults():
     assert config.theme is None
     assert config.show_cache_indicators is True
     assert config.show_timing is True
+    assert config.refresh_interval == 0.1
 
 
 def test_progress_config_custom():
@@ -198,6 +199,83 @@ def test_node_progress_bar_disabled():
     assert len(progress_bar.node_progress) == 0
 
 
+def test_node_progress_bar_description_alignment():
+    """Test that descriptions are padded to the longest node name and memoized."""
+    config = ProgressConfig()
+    colors = ThemeColors.for_theme("dark")
+    progress_bar = NodeProgressBar(config=config, theme_colors=colors)
+    progress_bar.initialize_nodes(["a", "longer_name"], items_count=1)
+
+    desc = progress_bar._format_description("a", "executing")
+    assert len(desc) == len("longer_name") + 2
+    assert progress_bar._format_description("a", "executing") is desc
+
+    progress_bar.stop()
+
+
+def test_node_progress_bar_throttles_updates():
+    """Test that rapid updates are coalesced until the refresh interval elapses."""
+    config = ProgressConfig(refresh_interval=60.0)
+    colors = ThemeColors.for_theme("dark")
+    progress_bar = NodeProgressBar(config=config, theme_colors=colors)
+    progress_bar.initialize_nodes(["node1"], items_count=5)
+
+    progress_bar.start_node("node1")
+    for completed in range(1, 5):
+        progress_bar.update_node_progress("node1", completed=completed, total=5)
+
+    # Updates are pending, not yet drawn
+    assert progress_bar.node_progress["node1"].n == 0
+    assert progress_bar._pending_delta["node1"] == 4
+
+    # Completing the node flushes everything
+    progress_bar.complete_node("node1")
+    assert progress_bar.node_progress["node1"].n == 5
+    assert "node1" not in progress_bar._pending_delta
+
+    progress_bar.stop()
+
+
+def test_node_progress_bar_shared_rich_display():
+    """Test that CLI rows share one rich Progress display."""
+    config = ProgressConfig()
+    colors = ThemeColors.for_theme("dark")
+    progress_bar = NodeProgressBar(config=config, theme_colors=colors)
+    progress_bar.initialize_nodes(["node1", "node2"], items_count=2)
+
+    live = progress_bar._live_progress
+    assert live is not None
+    assert len(live.tasks) == 2
+
+    progress_bar.complete_node("node1", execution_time=0.5)
+    assert live.tasks[0].completed == 2
+    assert live.tasks[0].fields["postfix"] == "time=0.50s"
+
+    progress_bar.stop()
+    assert progress_bar._live_progress is None
+
+
+def test_node_progress_bar_synchronized_output(capsys):
+    """Test that plain-tqdm CLI redraws are wrapped in synchronized-update escapes."""
+    config = ProgressConfig()
+    colors = ThemeColors.for_theme("dark")
+    progress_bar = NodeProgressBar(config=config, theme_colors=colors)
+    # Without rich, CLI rows are individual tqdm bars
+    with patch("daft_func.progress._RichProgress", None):
+        progress_bar.initialize_nodes(["node1"], items_count=1)
+    assert progress_bar._live_progress is None
+    capsys.readouterr()
+
+    progress_bar._sync_supported = True
+    progress_bar.start_node("node1")
+    out = capsys.readouterr().out
+    assert out.startswith("\x1b[?2026h")
+    assert out.endswith("\x1b[?2026l")
+
+    progress_bar._sync_supported = False
+    progress_bar.stop()
+
+
 # ============================================================================
 # Integration Tests with Runner
 # ============================================================================
@@ -1,5 +1,7 @@
 """Tests for DAG pipeline."""
 
+import dataclasses
+
 import pytest
 
 from daft_func.pipeline import NodeMeta, Pipeline
@@ -20,6 +22,58 @@ def test_pipeline_add_node():
     assert registry.by_output["result"].fn == my_func
 
 
+def test_pipeline_add_resolves_hints():
+    """Test that type hints are resolved once at registration."""
+    registry = Pipeline()
+
+    def my_func(a: int, b: str) -> float:
+        return float(a)
+
+    registry.add(my_func, NodeMeta(output_name="result"))
+
+    node = registry.by_output["result"]
+    assert node.hints == {"a": int, "b": str, "return": float}
+    assert node.defaults == {}
+    # Hints don't affect node identity
+    same = dataclasses.replace(node, hints={})
+    assert same == node
+    assert hash(same) == hash(node)
+
+
+def test_pipeline_add_records_defaults():
+    """Test that parameter defaults are captured at registration."""
+    registry = Pipeline()
+
+    def my_func(a: int, b: int = 3, c: str = "x") -> int:
+        return a + b
+
+    registry.add(my_func, NodeMeta(output_name="result"))
+
+    node = registry.by_output["result"]
+    assert node.defaults == {"b": 3, "c": "x"}
+    assert node.params_with_defaults == ("b", "c")
+
+
+def test_node_gather_kwargs():
+    """Test picking node arguments out of available values."""
+    registry = Pipeline()
+
+    def my_func(a: int, b: int, c: int = 3) -> int:
+        return a + b + c
+
+    registry.add(my_func, NodeMeta(output_name="result"))
+    node = registry.by_output["result"]
+
+    assert node.effective_params == ("a", "b", "c")
+    assert node.gather_kwargs({"a": 1, "b": 2, "c": 4, "x": 0}) == {
+        "a": 1,
+        "b": 2,
+        "c": 4,
+    }
+    # Unprovided defaulted params are omitted
+    assert node.gather_kwargs({"a": 1, "b": 2}) == {"a": 1, "b": 2}
+
+
 def test_pipeline_topo_sort_simple():
     """Test topological sort with simple dependencies."""
     registry = Pipeline()
@@ -67,6 +121,52 @@ def test_pipeline_topo_sort_parallel():
     assert set(output_names[:2]) == {"a_out", "b_out"}
 
 
+def test_pipeline_topo_order_deterministic():
+    """Test that ready nodes keep registration order within each pass."""
+    registry = Pipeline()
+
+    def late(y: int) -> int:
+        return y
+
+    def first(x: int) -> int:
+        return x
+
+    def second(x: int) -> int:
+        return x
+
+    def after_second(y: int, z: int) -> int:
+        return y + z
+
+    registry.add(late, NodeMeta(output_name="late_out"))
+    registry.add(first, NodeMeta(output_name="z"))
+    registry.add(second, NodeMeta(output_name="y"))
+    registry.add(after_second, NodeMeta(output_name="final"))
+
+    order = [n.fn.__name__ for n in registry.topo({"x": 1})]
+    assert order == ["first", "second", "after_second", "late"]
+
+
+def test_pipeline_topo_cache():
+    """Test that topo order is memoized by input names and reset on add."""
+    registry = Pipeline()
+
+    def step1(x: int) -> int:
+        return x + 1
+
+    def step2(a: int) -> int:
+        return a * 2
+
+    registry.add(step1, NodeMeta(output_name="a"))
+    first = registry.topo({"x": 1})
+    assert registry.topo({"x": 99}) == first
+    assert len(registry._topo_cache) == 1
+
+    registry.add(step2, NodeMeta(output_name="b"))
+    assert len(registry._topo_cache) == 0
+    order = registry.topo({"x": 1})
+    assert [n.meta.output_name for n in order] == ["a", "b"]
+
+
 def test_pipeline_topo_sort_circular_deps():
     """Test that circular dependencies raise an error."""
     registry = Pipeline()
@@ -98,3 +198,50 @@ def test_pipeline_clear():
     registry.clear()
     assert len(registry.nodes) == 0
     assert len(registry.by_output) == 0
+
+
+def test_func_decorator_copies_function():
+    """Test that @func returns a distinct node sharing the function's code."""
+    from daft_func import func
+
+    def my_func(a: int) -> int:
+        return a + 1
+
+    decorated = func(output="result")(my_func)
+    assert decorated is not my_func
+    assert decorated.__code__ is my_func.__code__
+    assert decorated._func_meta.output_name == "result"
+    assert not hasattr(my_func, "_func_meta")
+
+    # Identical metadata is a no-op; other metadata makes another node
+    assert func(output="result")(decorated) is decorated
+    other = func(output="other")(my_func)
+    assert other is not decorated
+    assert Pipeline(functions=[decorated]).nodes[0].meta.output_name == "result"
+    assert Pipeline(functions=[other]).nodes[0].meta.output_name == "other"
+
+
+def test_pipeline_compile_runs_nodes():
+    """Test that compiled runners match node semantics and are cached."""
+    registry = Pipeline()
+
+    def double(a: int) -> int:
+        return a * 2
+
+    def combine(doubled: int, b: int, scale: int = 1) -> int:
+        return (doubled + b) * scale
+
+    registry.add(double, NodeMeta(output_name="doubled"))
+    registry.add(combine, NodeMeta(output_name="total"))
+
+    run = registry.compile({"a": 0, "b": 0})
+    assert run({"a": 3, "b": 1}) == {"doubled": 6, "total": 7}
+    assert registry.compile({"a": 0, "b": 0}) is run
+
+    # Passing a defaulted param compiles a runner that forwards it
+    run_scaled = registry.compile({"a": 0, "b": 0, "scale": 0})
+    assert run_scaled is not run
+    assert run_scaled({"a": 3, "b": 1, "scale": 10}) == {"doubled": 6, "total": 70}
+
+    # Targets prune nodes like topo
+    assert registry.compile({"a": 0}, targets=["doubled"])({"a": 2}) == {"doubled": 4}
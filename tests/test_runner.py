@@ -1,5 +1,7 @@
 """Tests for DAG runner."""
 
+from typing import List, Optional
+
 import pytest
 from pydantic import BaseModel
 
@@ -68,6 +70,33 @@ def test_runner_multiple_items_local():
     assert result["result"][1].doubled == 20
 
 
+def test_runner_local_parallelism():
+    """Test that local mode can process items concurrently, preserving order."""
+    import threading
+
+    # Both items must be inside the node at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    @func(output="result", map_axis="item", key_attr="item_id")
+    def process(item: Item, multiplier: int) -> Result:
+        barrier.wait()
+        return Result(item_id=item.item_id, doubled=item.value * multiplier)
+
+    pipeline = Pipeline(functions=[process])
+    runner = Runner(pipeline=pipeline, mode="local", local_parallelism=2)
+    inputs = {
+        "item": [
+            Item(item_id="i1", value=5),
+            Item(item_id="i2", value=10),
+        ],
+        "multiplier": 2,
+    }
+
+    result = runner.run(inputs=inputs)
+    assert [r.item_id for r in result["result"]] == ["i1", "i2"]
+    assert [r.doubled for r in result["result"]] == [10, 20]
+
+
 def test_runner_multiple_items_daft():
     """Test runner with multiple items in daft mode."""
     pytest.importorskip("daft")
@@ -117,6 +146,29 @@ def test_runner_auto_mode_threshold():
     assert len(result["result"]) == 2
 
 
+def test_runner_auto_mode_measured_costs():
+    """Test auto mode switches to measured costs once both modes are timed."""
+
+    @func(output="result", map_axis="item", key_attr="item_id")
+    def process(item: Item, multiplier: int) -> Result:
+        return Result(item_id=item.item_id, doubled=item.value * multiplier)
+
+    runner = Runner(pipeline=Pipeline(functions=[process]), mode="auto")
+    # No measurements yet: static threshold applies
+    assert runner._choose_batching(True, 5)
+    assert not runner._choose_batching(True, 1)
+
+    runner._record_cost(batching=False, items_count=4, elapsed=0.004)
+    runner._udf_seconds = [0.001]
+    runner._record_cost(batching=True, items_count=2, elapsed=1.001)
+    assert runner._daft_startup_cost == pytest.approx(1.0)
+
+    # High Daft startup dominates small batches, per-item savings win large ones
+    assert not runner._choose_batching(True, 100)
+    runner._daft_startup_cost = 0.01
+    assert runner._choose_batching(True, 100)
+
+
 def test_runner_chained_nodes():
     """Test runner with multiple dependent nodes."""
 
@@ -141,6 +193,35 @@ def test_runner_chained_nodes():
     assert result["final"][0].doubled == 20  # (5 * 2) + 10
 
 
+@pytest.mark.parametrize("mode", ["local", "daft"])
+def test_runner_vectorized_node(mode):
+    """Test vectorized nodes get whole numeric columns in Daft mode."""
+    if mode == "daft":
+        pytest.importorskip("daft")
+
+    batch_sizes = []
+
+    @func(output="value", map_axis="item", key_attr="item_id")
+    def extract(item: Item) -> int:
+        return item.value
+
+    @func(output="scaled", map_axis="item", key_attr="item_id", vectorized=True)
+    def scale(value: int, factor: int) -> int:
+        batch_sizes.append(getattr(value, "shape", None))
+        return value * factor
+
+    pipeline = Pipeline(functions=[extract, scale])
+    runner = Runner(pipeline=pipeline, mode=mode)
+    items = [Item(item_id=f"i{i}", value=i) for i in range(4)]
+
+    result = runner.run(inputs={"item": items, "factor": 3})
+    assert result["scaled"] == [0, 3, 6, 9]
+    if mode == "daft":
+        assert batch_sizes == [(4,)]
+    else:
+        assert batch_sizes == [None] * 4
+
+
 def test_runner_constants_filtered():
     """Test that only relevant constants are passed to each node."""
 
@@ -260,3 +341,350 @@ def test_runner_non_mapped_with_mapped_daft():
     assert all(isinstance(hits, list) for hits in result["hits"])
     assert all(len(hits) == 2 for hits in result["hits"])  # top_k=2
     assert all(isinstance(hit, Hit) for hits in result["hits"] for hit in hits)
+
+
+def test_runner_daft_passes_models_through():
+    """Test that models flow through Daft columns without dump/validate round-trips."""
+    pytest.importorskip("daft")
+
+    seen_items = []
+    seen_results = []
+
+    @func(output="result", map_axis="item", key_attr="item_id")
+    def process(item: Item) -> Result:
+        seen_items.append(item)
+        return Result(item_id=item.item_id, doubled=item.value * 2)
+
+    @func(output="final", map_axis="item", key_attr="item_id")
+    def finalize(result: Result) -> Result:
+        seen_results.append(result)
+        return result
+
+    pipeline = Pipeline(functions=[process, finalize])
+    runner = Runner(pipeline=pipeline, mode="daft")
+    items = [Item(item_id="i1", value=5), Item(item_id="i2", value=10)]
+
+    result = runner.run(inputs={"item": items})
+
+    # Same instances are handed to the consuming nodes and returned
+    assert seen_items[0] is items[0] and seen_items[1] is items[1]
+    assert result["final"][0] is seen_results[0]
+    assert [r.doubled for r in result["final"]] == [10, 20]
+
+
+def test_runner_daft_fuses_mapped_chain():
+    """Test that a chain of row-wise mapped nodes runs as one fused UDF."""
+    pytest.importorskip("daft")
+
+    calls = []
+
+    @func(output="value", map_axis="item", key_attr="item_id")
+    def extract(item: Item) -> int:
+        calls.append("extract")
+        return item.value
+
+    @func(output="shifted", map_axis="item", key_attr="item_id")
+    def shift(value: int, offset: int) -> int:
+        calls.append("shift")
+        return value + offset
+
+    @func(output="final", map_axis="item", key_attr="item_id")
+    def finalize(shifted: int) -> Result:
+        calls.append("finalize")
+        return Result(item_id=str(shifted), doubled=shifted * 2)
+
+    pipeline = Pipeline(functions=[extract, shift, finalize])
+    runner = Runner(pipeline=pipeline, mode="daft")
+    items = [Item(item_id="i1", value=1), Item(item_id="i2", value=2)]
+
+    result = runner.run(inputs={"item": items, "offset": 10})
+
+    # Each row goes through the whole chain before the next row starts
+    assert calls == ["extract", "shift", "finalize"] * 2
+    assert [r.doubled for r in result["final"]] == [22, 24]
+    assert "value" not in result and "shifted" not in result
+
+
+def test_runner_daft_fuses_nodes_reading_map_axis():
+    """Test that fused nodes can also read the mapped item alongside a prior output."""
+    pytest.importorskip("daft")
+
+    calls = []
+
+    @func(output="value", map_axis="item", key_attr="item_id")
+    def extract(item: Item) -> int:
+        calls.append("extract")
+        return item.value
+
+    @func(output="final", map_axis="item", key_attr="item_id")
+    def combine(item: Item, value: int, offset: int) -> Result:
+        calls.append("combine")
+        return Result(item_id=item.item_id, doubled=(value + offset) * 2)
+
+    pipeline = Pipeline(functions=[extract, combine])
+    runner = Runner(pipeline=pipeline, mode="daft")
+    items = [Item(item_id="i1", value=1), Item(item_id="i2", value=2)]
+
+    result = runner.run(inputs={"item": items, "offset": 10})
+
+    assert calls == ["extract", "combine"] * 2
+    assert [(r.item_id, r.doubled) for r in result["final"]] == [
+        ("i1", 22),
+        ("i2", 24),
+    ]
+    assert "value" not in result
+
+
+def test_runner_daft_builds_typed_item_column():
+    """Test that dict-consuming batches get items typed from the model schema."""
+    pytest.importorskip("daft")
+
+    class Tagged(BaseModel):
+        item_id: str
+        tags: List[str]
+        score: Optional[float] = None
+
+    @func(output="summary", map_axis="item", key_attr="item_id")
+    def summarize(item: dict) -> str:
+        return f"{item['item_id']}:{len(item['tags'])}:{item['score']}"
+
+    pipeline = Pipeline(functions=[summarize])
+    runner = Runner(pipeline=pipeline, mode="daft")
+    # All-None optionals and empty lists give inference nothing to go on
+    items = [Tagged(item_id="a", tags=[]), Tagged(item_id="b", tags=["x", "y"])]
+
+    result = runner.run(inputs={"item": items})
+
+    assert result["summary"] == ["a:0:None", "b:2:None"]
+
+
+def test_runner_daft_skips_output_validation():
+    """Test that validate_output=False returns batch model outputs as dicts."""
+    pytest.importorskip("daft")
+
+    @func(output="result", map_axis="item", key_attr="item_id")
+    def process(item: Item) -> Result:
+        return Result(item_id=item.item_id, doubled=item.value * 2)
+
+    # A dict consumer makes "result" a struct column rather than objects
+    @func(output="label", map_axis="item", key_attr="item_id")
+    def label(result: dict) -> str:
+        return result["item_id"]
+
+    pipeline = Pipeline(functions=[process, label])
+    runner = Runner(pipeline=pipeline, mode="daft")
+    items = [Item(item_id="i1", value=1), Item(item_id="i2", value=2)]
+    targets = ["result", "label"]
+
+    result = runner.run(inputs={"item": items}, targets=targets, validate_output=False)
+    assert result["result"] == [
+        {"item_id": "i1", "doubled": 2},
+        {"item_id": "i2", "doubled": 4},
+    ]
+
+    # Validation is per run
+    result = runner.run(inputs={"item": items}, targets=targets)
+    assert all(isinstance(r, Result) for r in result["result"])
+
+
+def test_runner_node_parallelism_runs_branches_concurrently():
+    """Test that independent nodes of one item run at the same time."""
+    import threading
+
+    from daft_func import ProgressConfig
+
+    # Each branch waits for the other; run one at a time, the barrier times out
+    barrier = threading.Barrier(2, timeout=5)
+
+    @func(output="left")
+    def left(x: int) -> int:
+        barrier.wait()
+        return x + 1
+
+    @func(output="right")
+    def right(x: int) -> int:
+        barrier.wait()
+        return x * 10
+
+    @func(output="total")
+    def total(left: int, right: int) -> int:
+        return left + right
+
+    pipeline = Pipeline(functions=[left, right, total])
+    runner = Runner(
+        pipeline=pipeline,
+        mode="local",
+        node_parallelism=2,
+        progress_config=ProgressConfig(enabled=False),
+    )
+
+    result = runner.run(inputs={"x": 2})
+    assert result == {"x": 2, "left": 3, "right": 20, "total": 23}
+
+
+def test_runner_node_parallelism_runs_chains_inline():
+    """Test that a chain of nodes runs on one worker instead of one per node."""
+    import threading
+
+    from daft_func import ProgressConfig
+
+    threads = []
+
+    @func(output="a")
+    def step_a(x: int) -> int:
+        threads.append(threading.get_ident())
+        return x + 1
+
+    @func(output="b")
+    def step_b(a: int) -> int:
+        threads.append(threading.get_ident())
+        return a * 2
+
+    @func(output="c")
+    def step_c(b: int, x: int) -> int:
+        threads.append(threading.get_ident())
+        return b - x
+
+    pipeline = Pipeline(functions=[step_a, step_b, step_c])
+    runner = Runner(
+        pipeline=pipeline,
+        mode="local",
+        node_parallelism=4,
+        progress_config=ProgressConfig(enabled=False),
+    )
+
+    assert runner.run(inputs={"x": 3})["c"] == 5
+    assert len(threads) == 3 and len(set(threads)) == 1
+
+
+@pytest.mark.parametrize("mode", ["local", "daft"])
+def test_runner_targets_prune_unneeded_nodes(mode):
+    """Test that only nodes on the path to the requested targets run."""
+    if mode == "daft":
+        pytest.importorskip("daft")
+
+    executed = []
+
+    @func(output="doubled", map_axis="item", key_attr="item_id")
+    def double(item: Item) -> int:
+        executed.append("double")
+        return item.value * 2
+
+    @func(output="tripled", map_axis="item", key_attr="item_id")
+    def triple(item: Item) -> int:
+        executed.append("triple")
+        return item.value * 3
+
+    @func(output="total", map_axis="item", key_attr="item_id")
+    def total(doubled: int, tripled: int) -> int:
+        return doubled + tripled
+
+    pipeline = Pipeline(functions=[double, triple, total])
+    runner = Runner(pipeline=pipeline, mode=mode)
+    items = [Item(item_id="i1", value=1), Item(item_id="i2", value=2)]
+
+    result = runner.run(inputs={"item": items}, targets=["doubled"])
+    assert result["doubled"] == [2, 4]
+    assert "total" not in result
+    assert set(executed) == {"double"}
+
+
+def test_runner_targets_shapes_match_across_modes():
+    """Test that non-mapped targets are returned once in local and daft mode."""
+    pytest.importorskip("daft")
+
+    @func(output="scale")
+    def scale(k: int) -> int:
+        return k * 10
+
+    @func(output="y", map_axis="item", key_attr="item_id")
+    def scaled(item: Item, scale: int) -> int:
+        return item.value * scale
+
+    pipeline = Pipeline(functions=[scale, scaled])
+    items = [Item(item_id=f"i{i}", value=i) for i in range(3)]
+
+    results = [
+        Runner(pipeline=pipeline, mode=mode).run(
+            inputs={"item": items, "k": 2}, targets=["scale", "y"]
+        )
+        for mode in ("local", "daft")
+    ]
+    assert results[0]["scale"] == 20
+    assert results[0]["y"] == [0, 20, 40]
+    assert results[0] == results[1]
+
+
+def test_local_loop_collects_nodes_downstream_of_map_axis():
+    """Test that a node without map_axis reading a mapped output runs per item."""
+
+    @func(output="doubled", map_axis="item", key_attr="item_id")
+    def double(item: Item) -> int:
+        return item.value * 2
+
+    @func(output="label")
+    def label(doubled: int) -> str:
+        return f"v{doubled}"
+
+    pipeline = Pipeline(functions=[double, label])
+    runner = Runner(pipeline=pipeline, mode="local")
+    items = [Item(item_id="i1", value=1), Item(item_id="i2", value=2)]
+
+    result = runner.run(inputs={"item": items})
+    assert result["label"] == ["v2", "v4"]
+    assert "doubled" not in result
+
+
+def test_runner_daft_validates_items_into_declared_class():
+    """Test that a consumer declaring another model class gets that class."""
+    pytest.importorskip("daft")
+
+    class Summary(BaseModel):
+        item_id: str
+        value: int
+
+    class Tally(BaseModel):
+        item_id: str
+        doubled: int
+
+    @func(output="kind", map_axis="item", key_attr="item_id")
+    def describe(item: Summary) -> str:
+        return f"{type(item).__name__}:{item.value}"
+
+    @func(output="result", map_axis="item", key_attr="item_id")
+    def double(item: Item) -> Result:
+        return Result(item_id=item.item_id, doubled=item.value * 2)
+
+    @func(output="label", map_axis="item", key_attr="item_id")
+    def label(result: Tally) -> str:
+        return type(result).__name__
+
+    pipeline = Pipeline(functions=[describe, double, label])
+    runner = Runner(pipeline=pipeline, mode="daft")
+    items = [Item(item_id="i1", value=1), Item(item_id="i2", value=2)]
+
+    result = runner.run(inputs={"item": items}, targets=["kind", "label"])
+    assert result["kind"] == ["Summary:1", "Summary:2"]
+    assert result["label"] == ["Tally", "Tally"]
+
+
+def test_runner_targets_single_item():
+    """Test target pruning for a single-item run, including unknown targets."""
+
+    @func(output="a")
+    def step_a(x: int) -> int:
+        return x + 1
+
+    @func(output="b")
+    def step_b(y: int) -> int:
+        return y * 2
+
+    pipeline = Pipeline(functions=[step_a, step_b])
+    runner = Runner(pipeline=pipeline, mode="local")
+
+    # step_b's input is missing, but it isn't needed for "a"
+    result = runner.run(inputs={"x": 1}, targets=["a"])
+    assert result == {"x": 1, "a": 2}
+
+    with pytest.raises(ValueError, match="Unknown target output"):
+        runner.run(inputs={"x": 1}, targets=["missing"])
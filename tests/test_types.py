@@ -3,7 +3,14 @@
 import pytest
 from pydantic import BaseModel
 
-from daft_func.types import DAFT_AVAILABLE, daft_datatype, pyarrow_datatype
+from daft_func.types import (
+    DAFT_AVAILABLE,
+    TypeKind,
+    classify_type,
+    clear_type_caches,
+    daft_datatype,
+    pyarrow_datatype,
+)
 
 
 @pytest.mark.skipif(not DAFT_AVAILABLE, reason="Daft not available")
@@ -119,6 +126,24 @@ def test_daft_datatype_conversion():
     assert isinstance(daft_person, daft.DataType)
 
 
+@pytest.mark.skipif(not DAFT_AVAILABLE, reason="Daft not available")
+def test_pyarrow_datatype_cached():
+    """Test that conversions are computed once per type."""
+    from typing import List
+
+    class Doc(BaseModel):
+        id: str
+        tags: List[str]
+
+    clear_type_caches()
+    first = pyarrow_datatype(Doc)
+    assert pyarrow_datatype(Doc) is first
+    assert daft_datatype(Doc) is daft_datatype(Doc)
+
+    clear_type_caches()
+    assert pyarrow_datatype(Doc) == first
+
+
 def test_type_conversion_without_daft():
     """Test that appropriate errors are raised without Daft."""
     if DAFT_AVAILABLE:
@@ -146,3 +171,30 @@ def test_unsupported_types():
 
     with pytest.raises(TypeError, match="Cannot handle general Python objects"):
         pyarrow_datatype(CustomClass)
+
+
+def test_classify_type():
+    """Test classification of annotations for column deserialization."""
+    from typing import Dict, List
+
+    class Item(BaseModel):
+        id: str
+
+    assert classify_type(Item) == (TypeKind.MODEL, Item)
+    assert classify_type(List[Item]) == (TypeKind.LIST_MODEL, Item)
+    assert classify_type(list[Item]) == (TypeKind.LIST_MODEL, Item)
+    assert classify_type(List[int]) == (TypeKind.IDENTITY, None)
+    assert classify_type(Dict[str, Item]) == (TypeKind.IDENTITY, None)
+    assert classify_type(int) == (TypeKind.IDENTITY, None)
+
+
+def test_import_does_not_load_daft():
+    """Test that importing daft_func defers importing daft and pyarrow."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, daft_func; "
+        "assert 'daft' not in sys.modules and 'pyarrow' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -225,3 +225,112 @@ def test_grouped_args_with_shared_parameters():
 
     # 'b' should appear as individual node since it's used by multiple functions
     assert viz is not None
+
+
+def test_label_escaping_matches_html_escape():
+    """Test that label fragments are escaped like html.escape."""
+    import html
+
+    from daft_func.visualization import _esc
+
+    for text in ["plain", "Dict[str, List[int]]", "<a & 'b'>", '"x"', "&amp;"]:
+        assert _esc(text) == html.escape(text)
+
+
+def test_type_label_trims_and_escapes():
+    """Test the cached type label used in node labels."""
+    from typing import List
+
+    from daft_func.visualization import MAX_LABEL_LENGTH, _type_label
+
+    assert _type_label(int) == "int"
+    assert _type_label(List[int]) == "List"
+    assert _type_label("Box<int>") == "Box&lt;int&gt;"
+
+    long_hint = "Dict[str, Dict[str, Dict[str, List[int]]]]"
+    label = _type_label(long_hint)
+    assert label.endswith("...") and len(label) == MAX_LABEL_LENGTH
+    assert _type_label(long_hint) is label
+
+
+def test_grouped_parameter_graph_structure():
+    """Test that grouping replaces exclusive inputs with one GroupedArgs node."""
+    from daft_func.visualization import GroupedArgs, create_grouped_parameter_graph
+
+    @func(output="result1")
+    def func1(a: int, b: int, shared: int) -> int:
+        return a + b + shared
+
+    @func(output="result2")
+    def func2(result1: int, shared: int) -> int:
+        return result1 * shared
+
+    pipeline = Pipeline(functions=[func1, func2])
+    graph = build_graph(pipeline)
+    grouped = create_grouped_parameter_graph(graph, min_arg_group_size=2)
+
+    group = GroupedArgs(args=("a", "b"))
+    assert "a" not in grouped and "b" not in grouped
+    assert grouped.nodes[group]["node_type"] == "grouped_args"
+    func1_node = pipeline.by_output["result1"]
+    assert grouped.edges[group, func1_node]["param_name"] == "grouped"
+    assert grouped.has_edge("shared", func1_node)
+    assert grouped.has_edge(func1_node, pipeline.by_output["result2"])
+    # The input graph is left untouched
+    assert "a" in graph and "b" in graph
+
+
+def test_grouped_parameter_graph_skips_copy_without_groups():
+    """Test that the input graph is returned as-is when nothing is grouped."""
+    from daft_func.visualization import create_grouped_parameter_graph
+
+    @func(output="result")
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    graph = build_graph(Pipeline(functions=[add]))
+
+    assert create_grouped_parameter_graph(graph, min_arg_group_size=None) is graph
+    assert create_grouped_parameter_graph(graph, min_arg_group_size=3) is graph
+    assert create_grouped_parameter_graph(graph, min_arg_group_size=2) is not graph
+
+
+def test_pipeline_visualize_is_memoized(monkeypatch):
+    """Test that repeated visualize() calls reuse the rendering until nodes change."""
+    pytest.importorskip("graphviz")
+    import daft_func.visualization as viz_module
+    from daft_func.pipeline import NodeMeta
+
+    calls = []
+    original = viz_module.build_graph
+
+    def counting_build_graph(pipeline):
+        calls.append(pipeline)
+        return original(pipeline)
+
+    monkeypatch.setattr(viz_module, "build_graph", counting_build_graph)
+
+    pipeline = Pipeline()
+
+    def process(x: int, y: int) -> int:
+        return x + y
+
+    pipeline.add(process, NodeMeta(output_name="sum"))
+
+    first = pipeline.visualize(return_type="graphviz")
+    second = pipeline.visualize(return_type="graphviz")
+    assert len(calls) == 1
+    # Callers get independent copies of the cached Digraph
+    assert second is not first
+    assert second.source == first.source
+
+    # Other arguments and new nodes render again
+    pipeline.visualize(return_type="graphviz", orient="LR")
+    assert len(calls) == 2
+
+    def double(sum: int) -> int:
+        return sum * 2
+
+    pipeline.add(double, NodeMeta(output_name="doubled"))
+    assert "doubled" in pipeline.visualize(return_type="graphviz").source
+    assert len(calls) == 3